@@ -13,6 +13,7 @@ Options:
     --deep              Comprehensive research with more sources (50-70 Reddit, 40-60 X)
     --debug             Enable verbose debug logging
     --store             Persist findings to SQLite database
+    --no-cache          Bypass the on-disk API response cache
     --diagnose          Show source availability diagnostics and exit
 """
 
@@ -25,10 +26,13 @@ import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
 
 # Add lib to path
 SCRIPT_DIR = Path(__file__).parent.resolve()
+FIXTURES_DIR = SCRIPT_DIR.parent / "fixtures"
 sys.path.insert(0, str(SCRIPT_DIR))
 
 # ---------------------------------------------------------------------------
@@ -69,6 +73,12 @@ def _cleanup_children():
 
 atexit.register(_cleanup_children)
 
+# Shared worker pool for the search, enrichment and supplemental phases.
+# The phases run one after another, so 8 workers covers the widest phase and
+# also caps concurrent Reddit enrichment requests.
+_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="l30d")
+atexit.register(_POOL.shutdown, wait=True)
+
 
 def _install_global_timeout(timeout_seconds: int):
     """Install a global timeout watchdog.
@@ -96,35 +106,72 @@ def _install_global_timeout(timeout_seconds: int):
 
 from lib import (
     bird_x,
+    cache,
     dailydev,
     dates,
-    dedupe,
     entity_extract,
     env,
     http,
     models,
-    normalize,
     openai_reddit,
+    pipeline,
     reddit_enrich,
     render,
     schema,
-    score,
     tubelab_yt,
     twitterapi_x,
     ui,
-    websearch,
     xai_x,
     youtube_yt,
 )
 
 
+@lru_cache(maxsize=None)
 def load_fixture(name: str) -> dict:
-    """Load a fixture file."""
-    fixture_path = SCRIPT_DIR.parent / "fixtures" / name
-    if fixture_path.exists():
-        with open(fixture_path) as f:
-            return json.load(f)
-    return {}
+    """Load a fixture file.
+
+    Parsed fixtures are cached per name and shared between callers, so
+    treat the returned dict as read-only.
+    """
+    try:
+        # json.loads accepts UTF-8 bytes directly, skipping the text layer
+        return json.loads((FIXTURES_DIR / name).read_bytes())
+    except FileNotFoundError:
+        return {}
+
+
+def _openai_reddit_search(
+    query: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+) -> dict:
+    """Run an OpenAI Reddit search through the on-disk search cache."""
+    model = selected_models["openai"]
+    return cache.cached_search(
+        f"openai:{model}", query, from_date, to_date, depth,
+        lambda: openai_reddit.search_reddit(
+            config["OPENAI_API_KEY"], model, query, from_date, to_date, depth=depth,
+        ),
+    )
+
+
+def _twitterapi_search(
+    query: str,
+    config: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+) -> dict:
+    """Run a twitterapi.io search through the on-disk search cache."""
+    return cache.cached_search(
+        "twitterapi", query, from_date, to_date, depth,
+        lambda: twitterapi_x.search_x(
+            config["TWITTERAPI_IO_KEY"], query, from_date, to_date, depth=depth,
+        ),
+    )
 
 
 def _search_reddit(
@@ -148,13 +195,8 @@ def _search_reddit(
         raw_openai = load_fixture("openai_sample.json")
     else:
         try:
-            raw_openai = openai_reddit.search_reddit(
-                config["OPENAI_API_KEY"],
-                selected_models["openai"],
-                topic,
-                from_date,
-                to_date,
-                depth=depth,
+            raw_openai = _openai_reddit_search(
+                topic, config, selected_models, from_date, to_date, depth,
             )
         except http.HTTPError as e:
             raw_openai = {"error": str(e)}
@@ -166,24 +208,26 @@ def _search_reddit(
     # Parse response
     reddit_items = openai_reddit.parse_reddit_response(raw_openai or {})
 
+    # Live URL set so retry/fallback merges stay O(1) per item (first-seen wins)
+    seen_urls = {item.get("url") for item in reddit_items if item.get("url")}
+
     # Quick retry with simpler query if few results
-    if len(reddit_items) < 5 and not mock and not reddit_error:
+    # Skipped on --quick (speed matters; each retry is a full OpenAI search)
+    # and for single-word cores, which the subreddit fallback below covers
+    if len(reddit_items) < 5 and depth != "quick" and not mock and not reddit_error:
         core = openai_reddit._extract_core_subject(topic)
-        if core.lower() != topic.lower():
+        if core.lower() != topic.lower() and len(core.split()) >= 2:
             try:
-                retry_raw = openai_reddit.search_reddit(
-                    config["OPENAI_API_KEY"],
-                    selected_models["openai"],
-                    core,
-                    from_date, to_date,
-                    depth=depth,
+                retry_raw = _openai_reddit_search(
+                    core, config, selected_models, from_date, to_date, depth,
                 )
                 retry_items = openai_reddit.parse_reddit_response(retry_raw)
                 # Add items not already found (by URL)
-                existing_urls = {item.get("url") for item in reddit_items}
                 for item in retry_items:
-                    if item.get("url") not in existing_urls:
+                    url = item.get("url")
+                    if url and url not in seen_urls:
                         reddit_items.append(item)
+                        seen_urls.add(url)
             except Exception:
                 pass
 
@@ -191,18 +235,15 @@ def _search_reddit(
     if len(reddit_items) < 3 and not mock and not reddit_error:
         sub_query = openai_reddit._build_subreddit_query(topic)
         try:
-            sub_raw = openai_reddit.search_reddit(
-                config["OPENAI_API_KEY"],
-                selected_models["openai"],
-                sub_query,
-                from_date, to_date,
-                depth=depth,
+            sub_raw = _openai_reddit_search(
+                sub_query, config, selected_models, from_date, to_date, depth,
             )
             sub_items = openai_reddit.parse_reddit_response(sub_raw)
-            existing_urls = {item.get("url") for item in reddit_items}
             for item in sub_items:
-                if item.get("url") not in existing_urls:
+                url = item.get("url")
+                if url and url not in seen_urls:
                     reddit_items.append(item)
+                    seen_urls.add(url)
         except Exception:
             pass
 
@@ -239,13 +280,7 @@ def _search_x(
     if x_source == "twitterapi":
         raw_xai = None
         try:
-            raw_xai = twitterapi_x.search_x(
-                config["TWITTERAPI_IO_KEY"],
-                topic,
-                from_date,
-                to_date,
-                depth=depth,
-            )
+            raw_xai = _twitterapi_search(topic, config, from_date, to_date, depth)
         except Exception as e:
             raw_xai = {"error": str(e)}
             x_error = f"{type(e).__name__}: {e}"
@@ -258,12 +293,7 @@ def _search_x(
             core = openai_reddit._extract_core_subject(topic)
             if core.lower() != topic.lower():
                 try:
-                    retry_raw = twitterapi_x.search_x(
-                        config["TWITTERAPI_IO_KEY"],
-                        core,
-                        from_date, to_date,
-                        depth=depth,
-                    )
+                    retry_raw = _twitterapi_search(core, config, from_date, to_date, depth)
                     x_items = twitterapi_x.parse_x_response(retry_raw)
                     if x_items:
                         raw_xai = retry_raw
@@ -363,12 +393,11 @@ def _search_youtube_tubelab(
         raw_youtube = load_fixture("tubelab_sample.json")
     else:
         try:
-            raw_youtube = tubelab_yt.search_youtube(
-                config["TUBELAB_API_KEY"],
-                topic,
-                from_date,
-                to_date,
-                depth=depth,
+            raw_youtube = cache.cached_search(
+                "tubelab", topic, from_date, to_date, depth,
+                lambda: tubelab_yt.search_youtube(
+                    config["TUBELAB_API_KEY"], topic, from_date, to_date, depth=depth,
+                ),
             )
         except http.HTTPError as e:
             raw_youtube = {"error": str(e)}
@@ -538,50 +567,49 @@ def _run_supplemental(
     reddit_future = None
     x_future = None
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        if has_subs:
-            reddit_future = executor.submit(
-                openai_reddit.search_subreddits,
-                entities["reddit_subreddits"],
-                topic,
-                from_date,
-                to_date,
-                count_per,
-            )
+    if has_subs:
+        reddit_future = _POOL.submit(
+            openai_reddit.search_subreddits,
+            entities["reddit_subreddits"],
+            topic,
+            from_date,
+            to_date,
+            count_per,
+        )
 
-        if has_handles:
-            x_future = executor.submit(
-                bird_x.search_handles,
-                entities["x_handles"],
-                topic,
-                from_date,
-                count_per,
-            )
+    if has_handles:
+        x_future = _POOL.submit(
+            bird_x.search_handles,
+            entities["x_handles"],
+            topic,
+            from_date,
+            count_per,
+        )
 
-        if reddit_future:
-            try:
-                raw_reddit = reddit_future.result(timeout=30)
-                # Filter out URLs already found in Phase 1
-                supplemental_reddit = [
-                    item for item in raw_reddit
-                    if item.get("url", "") not in existing_urls
-                ]
-            except TimeoutError:
-                sys.stderr.write("[Phase 2] Supplemental Reddit timed out (30s)\n")
-            except Exception as e:
-                sys.stderr.write(f"[Phase 2] Supplemental Reddit error: {e}\n")
+    if reddit_future:
+        try:
+            raw_reddit = reddit_future.result(timeout=30)
+            # Filter out URLs already found in Phase 1
+            supplemental_reddit = [
+                item for item in raw_reddit
+                if item.get("url", "") not in existing_urls
+            ]
+        except TimeoutError:
+            sys.stderr.write("[Phase 2] Supplemental Reddit timed out (30s)\n")
+        except Exception as e:
+            sys.stderr.write(f"[Phase 2] Supplemental Reddit error: {e}\n")
 
-        if x_future:
-            try:
-                raw_x = x_future.result(timeout=30)
-                supplemental_x = [
-                    item for item in raw_x
-                    if item.get("url", "") not in existing_urls
-                ]
-            except TimeoutError:
-                sys.stderr.write("[Phase 2] Supplemental X timed out (30s)\n")
-            except Exception as e:
-                sys.stderr.write(f"[Phase 2] Supplemental X error: {e}\n")
+    if x_future:
+        try:
+            raw_x = x_future.result(timeout=30)
+            supplemental_x = [
+                item for item in raw_x
+                if item.get("url", "") not in existing_urls
+            ]
+        except TimeoutError:
+            sys.stderr.write("[Phase 2] Supplemental X timed out (30s)\n")
+        except Exception as e:
+            sys.stderr.write(f"[Phase 2] Supplemental X error: {e}\n")
 
     if supplemental_reddit or supplemental_x:
         sys.stderr.write(
@@ -612,12 +640,11 @@ def _search_dailydev(
         raw_dailydev = load_fixture("dailydev_sample.json")
     else:
         try:
-            raw_dailydev = dailydev.search_dailydev(
-                config["DAILYDEV_API_KEY"],
-                topic,
-                from_date,
-                to_date,
-                depth=depth,
+            raw_dailydev = cache.cached_search(
+                "dailydev", topic, from_date, to_date, depth,
+                lambda: dailydev.search_dailydev(
+                    config["DAILYDEV_API_KEY"], topic, from_date, to_date, depth=depth,
+                ),
             )
         except http.HTTPError as e:
             raw_dailydev = {"error": str(e)}
@@ -632,6 +659,45 @@ def _search_dailydev(
     return dailydev_items, raw_dailydev, dailydev_error
 
 
+# Which searches each effective --sources mode runs
+REDDIT_SOURCES = frozenset({"both", "reddit", "all", "reddit-web"})
+X_SOURCES = frozenset({"both", "x", "all", "x-web"})
+WEB_SOURCES = frozenset({"all", "web", "reddit-web", "x-web"})
+
+# Effective sources -> report mode label
+SOURCE_MODES = {
+    "all": "all",  # reddit + x + web
+    "both": "both",  # reddit + x
+    "reddit": "reddit-only",
+    "reddit-web": "reddit-web",
+    "x": "x-only",
+    "x-web": "x-web",
+    "web": "web-only",
+}
+
+
+class ResearchResult(NamedTuple):
+    """Raw output of the research phase, consumed by main().
+
+    Both return sites in run_research fill every field by keyword.
+    """
+    reddit_items: List[Dict[str, Any]]
+    x_items: List[Dict[str, Any]]
+    youtube_items: List[Dict[str, Any]]
+    web_items: List[Dict[str, Any]]
+    web_needed: bool
+    raw_openai: Optional[dict]
+    raw_xai: Optional[dict]
+    raw_reddit_enriched: List[Dict[str, Any]]
+    reddit_error: Optional[str]
+    x_error: Optional[str]
+    youtube_error: Optional[str]
+    web_error: Optional[str]
+    dailydev_items: List[Dict[str, Any]]
+    raw_dailydev: Optional[dict]
+    dailydev_error: Optional[str]
+
+
 def run_research(
     topic: str,
     sources: str,
@@ -647,14 +713,11 @@ def run_research(
     run_youtube: bool = False,
     use_tubelab: bool = False,
     timeouts: dict = None,
-) -> tuple:
+) -> ResearchResult:
     """Run the research pipeline.
 
     Returns:
-        Tuple of (reddit_items, x_items, youtube_items, web_items, web_needed,
-                  raw_openai, raw_xai, raw_reddit_enriched,
-                  reddit_error, x_error, youtube_error, web_error,
-                  dailydev_items, raw_dailydev, dailydev_error)
+        ResearchResult with items, raw responses and errors per source
 
     Note: web_needed is True when web search should be performed by the assistant
     (i.e., no native web search API keys are configured). When native web search
@@ -673,7 +736,6 @@ def run_research(
     raw_xai = None
     raw_dailydev = None
     raw_youtube = None
-    raw_reddit_enriched = []
     reddit_error = None
     x_error = None
     dailydev_error = None
@@ -681,7 +743,7 @@ def run_research(
     web_error = None
 
     # Determine web search mode
-    do_web = sources in ("all", "web", "reddit-web", "x-web")
+    do_web = sources in WEB_SOURCES
     web_backend = env.get_web_search_source(config) if do_web else None
     web_needed = do_web and not web_backend
 
@@ -723,18 +785,27 @@ def run_research(
                     progress.show_error(f"YouTube error: {e}")
             if progress:
                 progress.end_youtube(len(youtube_items))
-        return (reddit_items, x_items, youtube_items, web_items, web_needed,
-                raw_openai, raw_xai, raw_reddit_enriched,
-                reddit_error, x_error, youtube_error, web_error,
-                dailydev_items, raw_dailydev, dailydev_error)
+        return ResearchResult(
+            reddit_items=reddit_items,
+            x_items=x_items,
+            youtube_items=youtube_items,
+            web_items=web_items,
+            web_needed=web_needed,
+            raw_openai=raw_openai,
+            raw_xai=raw_xai,
+            raw_reddit_enriched=[],
+            reddit_error=reddit_error,
+            x_error=x_error,
+            youtube_error=youtube_error,
+            web_error=web_error,
+            dailydev_items=dailydev_items,
+            raw_dailydev=raw_dailydev,
+            dailydev_error=dailydev_error,
+        )
 
     # Determine which searches to run
-    do_reddit = sources in ("both", "reddit", "all", "reddit-web")
-    do_x = sources in ("both", "x", "all", "x-web")
-
-    # Count workers needed
-    worker_count = sum([do_reddit, do_x, run_dailydev, run_youtube, bool(web_backend)])
-    worker_count = max(worker_count, 1)
+    do_reddit = sources in REDDIT_SOURCES
+    do_x = sources in X_SOURCES
 
     # Run searches in parallel
     reddit_future = None
@@ -743,129 +814,128 @@ def run_research(
     youtube_future = None
     web_future = None
 
-    with ThreadPoolExecutor(max_workers=worker_count) as executor:
-        # Submit searches
-        if do_reddit:
-            if progress:
-                progress.start_reddit()
-            reddit_future = executor.submit(
-                _search_reddit, topic, config, selected_models,
-                from_date, to_date, depth, mock
-            )
+    # Submit searches
+    if do_reddit:
+        if progress:
+            progress.start_reddit()
+        reddit_future = _POOL.submit(
+            _search_reddit, topic, config, selected_models,
+            from_date, to_date, depth, mock
+        )
 
-        if do_x:
-            if progress:
-                progress.start_x()
-            x_future = executor.submit(
-                _search_x, topic, config, selected_models,
-                from_date, to_date, depth, mock, x_source
-            )
+    if do_x:
+        if progress:
+            progress.start_x()
+        x_future = _POOL.submit(
+            _search_x, topic, config, selected_models,
+            from_date, to_date, depth, mock, x_source
+        )
 
-        if run_dailydev:
-            if progress:
-                progress.start_dailydev()
-            dailydev_future = executor.submit(
-                _search_dailydev, topic, config,
-                from_date, to_date, depth, mock
-            )
+    if run_dailydev:
+        if progress:
+            progress.start_dailydev()
+        dailydev_future = _POOL.submit(
+            _search_dailydev, topic, config,
+            from_date, to_date, depth, mock
+        )
 
-        if run_youtube:
-            if progress:
-                progress.start_youtube()
-            youtube_future = executor.submit(
-                _search_youtube, topic, config,
-                from_date, to_date, depth, mock
-            )
+    if run_youtube:
+        if progress:
+            progress.start_youtube()
+        youtube_future = _POOL.submit(
+            _search_youtube, topic, config,
+            from_date, to_date, depth, mock
+        )
 
-        if web_backend:
-            sys.stderr.write(f"[web] Searching via {web_backend}\n")
-            sys.stderr.flush()
-            web_future = executor.submit(
-                _search_web, topic, config, from_date, to_date, depth
-            )
+    if web_backend:
+        sys.stderr.write(f"[web] Searching via {web_backend}\n")
+        sys.stderr.flush()
+        web_future = _POOL.submit(
+            _search_web, topic, config, from_date, to_date, depth
+        )
 
-        # Collect results (with timeouts to prevent indefinite blocking)
-        if reddit_future:
-            reddit_timeout = timeouts.get("reddit_future", future_timeout)
-            try:
-                reddit_items, raw_openai, reddit_error = reddit_future.result(timeout=reddit_timeout)
-                if reddit_error and progress:
-                    progress.show_error(f"Reddit error: {reddit_error}")
-            except TimeoutError:
-                reddit_error = f"Reddit search timed out after {reddit_timeout}s"
-                if progress:
-                    progress.show_error(reddit_error)
-            except Exception as e:
-                reddit_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Reddit error: {e}")
+    # Collect results (with timeouts to prevent indefinite blocking)
+    if reddit_future:
+        reddit_timeout = timeouts.get("reddit_future", future_timeout)
+        try:
+            reddit_items, raw_openai, reddit_error = reddit_future.result(timeout=reddit_timeout)
+            if reddit_error and progress:
+                progress.show_error(f"Reddit error: {reddit_error}")
+        except TimeoutError:
+            reddit_error = f"Reddit search timed out after {reddit_timeout}s"
+            if progress:
+                progress.show_error(reddit_error)
+        except Exception as e:
+            reddit_error = f"{type(e).__name__}: {e}"
             if progress:
-                progress.end_reddit(len(reddit_items))
+                progress.show_error(f"Reddit error: {e}")
+        if progress:
+            progress.end_reddit(len(reddit_items))
 
-        if x_future:
-            try:
-                x_items, raw_xai, x_error = x_future.result(timeout=future_timeout)
-                if x_error and progress:
-                    progress.show_error(f"X error: {x_error}")
-            except TimeoutError:
-                x_error = f"X search timed out after {future_timeout}s"
-                if progress:
-                    progress.show_error(x_error)
-            except Exception as e:
-                x_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"X error: {e}")
+    if x_future:
+        try:
+            x_items, raw_xai, x_error = x_future.result(timeout=future_timeout)
+            if x_error and progress:
+                progress.show_error(f"X error: {x_error}")
+        except TimeoutError:
+            x_error = f"X search timed out after {future_timeout}s"
+            if progress:
+                progress.show_error(x_error)
+        except Exception as e:
+            x_error = f"{type(e).__name__}: {e}"
             if progress:
-                progress.end_x(len(x_items))
+                progress.show_error(f"X error: {e}")
+        if progress:
+            progress.end_x(len(x_items))
 
-        if dailydev_future:
-            try:
-                dailydev_items, raw_dailydev, dailydev_error = dailydev_future.result(timeout=future_timeout)
-                if dailydev_error and progress:
-                    progress.show_error(f"DailyDev error: {dailydev_error}")
-            except TimeoutError:
-                dailydev_error = f"DailyDev search timed out after {future_timeout}s"
-                if progress:
-                    progress.show_error(dailydev_error)
-            except Exception as e:
-                dailydev_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"DailyDev error: {e}")
+    if dailydev_future:
+        try:
+            dailydev_items, raw_dailydev, dailydev_error = dailydev_future.result(timeout=future_timeout)
+            if dailydev_error and progress:
+                progress.show_error(f"DailyDev error: {dailydev_error}")
+        except TimeoutError:
+            dailydev_error = f"DailyDev search timed out after {future_timeout}s"
+            if progress:
+                progress.show_error(dailydev_error)
+        except Exception as e:
+            dailydev_error = f"{type(e).__name__}: {e}"
             if progress:
-                progress.end_dailydev(len(dailydev_items))
+                progress.show_error(f"DailyDev error: {e}")
+        if progress:
+            progress.end_dailydev(len(dailydev_items))
 
-        if youtube_future:
-            yt_timeout = timeouts.get("youtube_future", future_timeout)
-            try:
-                youtube_items, youtube_error = youtube_future.result(timeout=yt_timeout)
-                if youtube_error and progress:
-                    progress.show_error(f"YouTube error: {youtube_error}")
-            except TimeoutError:
-                youtube_error = f"YouTube search timed out after {yt_timeout}s"
-                if progress:
-                    progress.show_error(youtube_error)
-            except Exception as e:
-                youtube_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"YouTube error: {e}")
+    if youtube_future:
+        yt_timeout = timeouts.get("youtube_future", future_timeout)
+        try:
+            youtube_items, youtube_error = youtube_future.result(timeout=yt_timeout)
+            if youtube_error and progress:
+                progress.show_error(f"YouTube error: {youtube_error}")
+        except TimeoutError:
+            youtube_error = f"YouTube search timed out after {yt_timeout}s"
             if progress:
-                progress.end_youtube(len(youtube_items))
+                progress.show_error(youtube_error)
+        except Exception as e:
+            youtube_error = f"{type(e).__name__}: {e}"
+            if progress:
+                progress.show_error(f"YouTube error: {e}")
+        if progress:
+            progress.end_youtube(len(youtube_items))
 
-        if web_future:
-            try:
-                web_items, web_error = web_future.result(timeout=future_timeout)
-                if web_error and progress:
-                    progress.show_error(f"Web error: {web_error}")
-            except TimeoutError:
-                web_error = f"Web search timed out after {future_timeout}s"
-                if progress:
-                    progress.show_error(web_error)
-            except Exception as e:
-                web_error = f"{type(e).__name__}: {e}"
-                if progress:
-                    progress.show_error(f"Web error: {e}")
-            sys.stderr.write(f"[web] {len(web_items)} results\n")
-            sys.stderr.flush()
+    if web_future:
+        try:
+            web_items, web_error = web_future.result(timeout=future_timeout)
+            if web_error and progress:
+                progress.show_error(f"Web error: {web_error}")
+        except TimeoutError:
+            web_error = f"Web search timed out after {future_timeout}s"
+            if progress:
+                progress.show_error(web_error)
+        except Exception as e:
+            web_error = f"{type(e).__name__}: {e}"
+            if progress:
+                progress.show_error(f"Web error: {e}")
+        sys.stderr.write(f"[web] {len(web_items)} results\n")
+        sys.stderr.flush()
 
     # Enrich Reddit items with real data (parallel, capped)
     enrich_max = timeouts["enrich_max_items"]
@@ -888,55 +958,72 @@ def run_research(
                 except Exception as e:
                     if progress:
                         progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
-                raw_reddit_enriched.append(reddit_items[i])
         else:
             # Parallel enrichment with bounded concurrency and total timeout
-            # Uses short HTTP timeout (10s) and 1 retry to fail fast on 429
+            # Uses short HTTP timeout (10s) and 1 retry to fail fast on 429.
+            # Workers get shallow copies: a task still running after the
+            # timeout must not touch items we go on to normalize and dump.
             completed_count = 0
             rate_limited = False
-            with ThreadPoolExecutor(max_workers=5) as enrich_pool:
-                futures = {
-                    enrich_pool.submit(reddit_enrich.enrich_reddit_item, item): i
-                    for i, item in enumerate(items_to_enrich)
-                }
-                try:
-                    for future in as_completed(futures, timeout=enrich_total_timeout):
-                        idx = futures[future]
-                        completed_count += 1
+            timed_out = False
+            futures = {
+                _POOL.submit(reddit_enrich.enrich_reddit_item, dict(item)): i
+                for i, item in enumerate(items_to_enrich)
+            }
+            try:
+                for future in as_completed(futures, timeout=enrich_total_timeout):
+                    idx = futures[future]
+                    completed_count += 1
+                    if progress:
+                        progress.update_reddit_enrich(completed_count, len(items_to_enrich))
+                    try:
+                        reddit_items[idx] = future.result(timeout=timeouts["enrich_per"])
+                    except reddit_enrich.RedditRateLimitError:
+                        rate_limited = True
+                        if progress:
+                            progress.show_error(
+                                "Reddit rate-limited (429) -- skipping remaining enrichment"
+                            )
+                        # Cancel remaining futures and bail
+                        for f in futures:
+                            f.cancel()
+                        break
+                    except Exception as e:
                         if progress:
-                            progress.update_reddit_enrich(completed_count, len(items_to_enrich))
-                        try:
-                            reddit_items[idx] = future.result(timeout=timeouts["enrich_per"])
-                        except reddit_enrich.RedditRateLimitError:
-                            rate_limited = True
-                            if progress:
-                                progress.show_error(
-                                    "Reddit rate-limited (429) -- skipping remaining enrichment"
-                                )
-                            # Cancel remaining futures and bail
-                            for f in futures:
-                                f.cancel()
-                            break
-                        except Exception as e:
-                            if progress:
-                                progress.show_error(
-                                    f"Enrich failed for {items_to_enrich[idx].get('url', 'unknown')}: {e}"
-                                )
-                        raw_reddit_enriched.append(reddit_items[idx])
-                except TimeoutError:
+                            progress.show_error(
+                                f"Enrich failed for {items_to_enrich[idx].get('url', 'unknown')}: {e}"
+                            )
+            except TimeoutError:
+                timed_out = True
+                # Drop queued work so it doesn't hold up Phase 2 on the shared pool
+                for f in futures:
+                    f.cancel()
+                if progress:
+                    progress.show_error(
+                        f"Enrichment timed out after {enrich_total_timeout}s "
+                        f"({completed_count}/{len(items_to_enrich)} done)"
+                    )
+
+            # Items past the cap get real engagement from one batched
+            # /api/info request per 100 threads (no comments). Skipped when
+            # Reddit is already slow or rate-limiting us.
+            remaining = reddit_items[enrich_max:]
+            if remaining and not rate_limited and not timed_out:
+                try:
+                    reddit_enrich.enrich_reddit_items_batch(remaining, timeout=timeouts["enrich_per"])
+                except reddit_enrich.RedditRateLimitError:
+                    rate_limited = True
+                except Exception as e:
                     if progress:
-                        progress.show_error(
-                            f"Enrichment timed out after {enrich_total_timeout}s "
-                            f"({completed_count}/{len(items_to_enrich)} done)"
-                        )
-                    # Keep unenriched items as-is
-                    for idx in futures.values():
-                        if reddit_items[idx] not in raw_reddit_enriched:
-                            raw_reddit_enriched.append(reddit_items[idx])
+                        progress.show_error(f"Batch enrich failed: {e}")
 
         if progress:
             progress.end_reddit_enrich()
 
+    # Enriched copies were written back by index, in search order (items whose
+    # fetch failed or finished too late are kept as-is). Slice now: Phase 2 extends reddit_items.
+    raw_reddit_enriched = reddit_items[:len(items_to_enrich)]
+
     # Phase 2: Supplemental search based on entities from Phase 1
     # Skip on --quick (speed matters), mock mode, or if Reddit is rate-limiting
     if depth != "quick" and not mock and (reddit_items or x_items):
@@ -950,10 +1037,23 @@ def run_research(
         if sup_x:
             x_items.extend(sup_x)
 
-    return (reddit_items, x_items, youtube_items, web_items, web_needed,
-            raw_openai, raw_xai, raw_reddit_enriched,
-            reddit_error, x_error, youtube_error, web_error,
-            dailydev_items, raw_dailydev, dailydev_error)
+    return ResearchResult(
+        reddit_items=reddit_items,
+        x_items=x_items,
+        youtube_items=youtube_items,
+        web_items=web_items,
+        web_needed=web_needed,
+        raw_openai=raw_openai,
+        raw_xai=raw_xai,
+        raw_reddit_enriched=raw_reddit_enriched,
+        reddit_error=reddit_error,
+        x_error=x_error,
+        youtube_error=youtube_error,
+        web_error=web_error,
+        dailydev_items=dailydev_items,
+        raw_dailydev=raw_dailydev,
+        dailydev_error=dailydev_error,
+    )
 
 
 def main():
@@ -1032,6 +1132,11 @@ def main():
         action="store_true",
         help="Show source availability diagnostics and exit",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk API response cache (6h TTL)",
+    )
     parser.add_argument(
         "--timeout",
         type=int,
@@ -1049,6 +1154,9 @@ def main():
         from lib import http as http_module
         http_module.DEBUG = True
 
+    if args.no_cache:
+        cache.SEARCH_CACHE_ENABLED = False
+
     # Determine depth
     if args.quick and args.deep:
         print("Error: Cannot use both --quick and --deep", file=sys.stderr)
@@ -1204,22 +1312,7 @@ def main():
         selected_models = models.get_models(config)
 
     # Determine mode string
-    if sources == "all":
-        mode = "all"  # reddit + x + web
-    elif sources == "both":
-        mode = "both"  # reddit + x
-    elif sources == "reddit":
-        mode = "reddit-only"
-    elif sources == "reddit-web":
-        mode = "reddit-web"
-    elif sources == "x":
-        mode = "x-only"
-    elif sources == "x-web":
-        mode = "x-web"
-    elif sources == "web":
-        mode = "web-only"
-    else:
-        mode = sources
+    mode = SOURCE_MODES.get(sources, sources)
 
     # Determine if DailyDev should run
     # Auto-enable when key present + not web-only mode, or explicit --dailydev flag
@@ -1238,10 +1331,7 @@ def main():
     )
 
     # Run research
-    (reddit_items, x_items, youtube_items, web_items, web_needed,
-     raw_openai, raw_xai, raw_reddit_enriched,
-     reddit_error, x_error, youtube_error, web_error,
-     dailydev_items, raw_dailydev, dailydev_error) = run_research(
+    research = run_research(
         args.topic,
         sources,
         config,
@@ -1261,44 +1351,12 @@ def main():
     # Processing phase
     progress.start_processing()
 
-    # Normalize items
-    normalized_reddit = normalize.normalize_reddit_items(reddit_items, from_date, to_date)
-    normalized_x = normalize.normalize_x_items(x_items, from_date, to_date)
-    normalized_dailydev = normalize.normalize_dailydev_items(dailydev_items, from_date, to_date)
-    normalized_youtube = normalize.normalize_youtube_items(youtube_items, from_date, to_date) if youtube_items else []
-    normalized_web = websearch.normalize_websearch_items(web_items, from_date, to_date) if web_items else []
-
-    # Hard date filter: exclude items with verified dates outside the range
-    # This is the safety net - even if prompts let old content through, this filters it
-    filtered_reddit = normalize.filter_by_date_range(normalized_reddit, from_date, to_date)
-    filtered_x = normalize.filter_by_date_range(normalized_x, from_date, to_date)
-    filtered_dailydev = normalize.filter_by_date_range(normalized_dailydev, from_date, to_date)
-    # YouTube: skip hard date filter -- youtube_yt.py already applies a soft filter
-    # that prefers recent videos but keeps older ones for evergreen topics.
-    # YouTube content has a longer shelf life than tweets/posts.
-    filtered_youtube = normalized_youtube
-    filtered_web = normalize.filter_by_date_range(normalized_web, from_date, to_date) if normalized_web else []
-
-    # Score items
-    scored_reddit = score.score_reddit_items(filtered_reddit)
-    scored_x = score.score_x_items(filtered_x)
-    scored_dailydev = score.score_dailydev_items(filtered_dailydev)
-    scored_youtube = score.score_youtube_items(filtered_youtube) if filtered_youtube else []
-    scored_web = score.score_websearch_items(filtered_web) if filtered_web else []
-
-    # Sort items
-    sorted_reddit = score.sort_items(scored_reddit)
-    sorted_x = score.sort_items(scored_x)
-    sorted_dailydev = score.sort_items(scored_dailydev)
-    sorted_youtube = score.sort_items(scored_youtube) if scored_youtube else []
-    sorted_web = score.sort_items(scored_web) if scored_web else []
-
-    # Dedupe items
-    deduped_reddit = dedupe.dedupe_reddit(sorted_reddit)
-    deduped_x = dedupe.dedupe_x(sorted_x)
-    deduped_dailydev = dedupe.dedupe_dailydev(sorted_dailydev)
-    deduped_youtube = dedupe.dedupe_youtube(sorted_youtube) if sorted_youtube else []
-    deduped_web = websearch.dedupe_websearch(sorted_web) if sorted_web else []
+    # Normalize, date-filter, score, sort and dedupe each source
+    normalized_reddit, deduped_reddit = pipeline.process_source(research.reddit_items, from_date, to_date, "reddit")
+    _, deduped_x = pipeline.process_source(research.x_items, from_date, to_date, "x")
+    _, deduped_dailydev = pipeline.process_source(research.dailydev_items, from_date, to_date, "dailydev")
+    _, deduped_youtube = pipeline.process_source(research.youtube_items, from_date, to_date, "youtube")
+    _, deduped_web = pipeline.process_source(research.web_items, from_date, to_date, "web")
 
     # Minimum result guarantee: if all Reddit results were filtered out but
     # we had raw results, keep top 3 by relevance regardless of score
@@ -1323,17 +1381,20 @@ def main():
     report.dailydev = deduped_dailydev
     report.youtube = deduped_youtube
     report.web = deduped_web
-    report.reddit_error = reddit_error
-    report.x_error = x_error
-    report.dailydev_error = dailydev_error
-    report.youtube_error = youtube_error
-    report.web_error = web_error
+    report.reddit_error = research.reddit_error
+    report.x_error = research.x_error
+    report.dailydev_error = research.dailydev_error
+    report.youtube_error = research.youtube_error
+    report.web_error = research.web_error
 
     # Generate context snippet
     report.context_snippet_md = render.render_context_snippet(report)
 
     # Write outputs
-    render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched, raw_dailydev)
+    render.write_outputs(
+        report, research.raw_openai, research.raw_xai,
+        research.raw_reddit_enriched, research.raw_dailydev,
+    )
 
     # Show completion
     if sources == "web":
@@ -1362,7 +1423,7 @@ def main():
         source_info["web_skip_reason"] = "assistant will use WebSearch (add BRAVE_API_KEY for native search)"
 
     # Output result
-    output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys, args.days, source_info)
+    output_result(report, args.emit, research.web_needed, args.topic, from_date, to_date, missing_keys, args.days, source_info)
 
     # Persist findings to SQLite if requested
     if args.store:
@@ -1437,6 +1498,20 @@ def main():
         sys.stderr.flush()
 
 
+def _emit_json(data: dict):
+    """Write indented JSON to stdout as bytes, bypassing the text encoder."""
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # stdout replaced by a text-only stream (e.g. captured in tests)
+        print(payload.decode("utf-8"))
+        return
+    sys.stdout.flush()  # keep ordering with earlier print() output
+    out.write(payload)
+    out.write(b"\n")
+    out.flush()
+
+
 def output_result(
     report: schema.Report,
     emit_mode: str,
@@ -1454,7 +1529,7 @@ def output_result(
         # Append source status footer
         print(render.render_source_status(report, source_info))
     elif emit_mode == "json":
-        print(json.dumps(report.to_dict(), indent=2))
+        _emit_json(report.to_dict())
     elif emit_mode == "md":
         print(render.render_full_report(report))
     elif emit_mode == "context":
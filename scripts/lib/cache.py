@@ -6,13 +6,17 @@ import os
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 CACHE_DIR = Path.home() / ".cache" / "last30days"
 DEFAULT_TTL_HOURS = 24
+SEARCH_CACHE_TTL_HOURS = 6
 MODEL_CACHE_TTL_DAYS = 7
 MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
 
+# Disabled by --no-cache
+SEARCH_CACHE_ENABLED = True
+
 
 def ensure_cache_dir():
     """Ensure cache directory exists. Supports env override and sandbox fallback."""
@@ -105,16 +109,59 @@ def load_cache_with_age(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> t
 
 def save_cache(cache_key: str, data: dict):
     """Save data to cache."""
-    ensure_cache_dir()
-    cache_path = get_cache_path(cache_key)
-
     try:
+        ensure_cache_dir()
+        cache_path = get_cache_path(cache_key)
         with open(cache_path, 'w') as f:
             json.dump(data, f)
     except OSError:
         pass  # Silently fail on cache write errors
 
 
+def cached_search(
+    source: str,
+    topic: str,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    fetch: Callable[[], Any],
+    ttl_hours: int = SEARCH_CACHE_TTL_HOURS,
+) -> Any:
+    """Return a cached API search response, or fetch and cache it.
+
+    Error responses (dicts with a truthy "error") are never cached.
+
+    Args:
+        source: Backend name, included in the key (e.g. "dailydev")
+        topic: Search topic
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        depth: Research depth
+        fetch: Zero-argument callable that performs the real API call
+        ttl_hours: Cache lifetime in hours
+
+    Returns:
+        Parsed API response
+    """
+    if not SEARCH_CACHE_ENABLED:
+        return fetch()
+
+    try:
+        ensure_cache_dir()
+        cache_key = get_cache_key(topic, from_date, to_date, f"{source}|{depth}")
+        cached = load_cache(cache_key, ttl_hours)
+    except OSError:
+        # Unusable cache dir: treat as a miss and skip saving
+        return fetch()
+    if cached is not None:
+        return cached
+
+    result = fetch()
+    if not (isinstance(result, dict) and result.get("error")):
+        save_cache(cache_key, result)
+    return result
+
+
 def clear_cache():
     """Clear all cache files."""
     if CACHE_DIR.exists():
@@ -6,7 +6,6 @@ Requires a daily.dev Plus subscription and API key (DAILYDEV_API_KEY).
 
 import math
 from typing import Any, Dict, List, Optional
-from urllib.parse import quote
 
 from . import http
 
@@ -51,9 +50,30 @@ def search_dailydev(
 
     # Note: 'time' parameter causes HTTP 500 on daily.dev API, so we omit it
     # and rely on downstream date filtering instead
-    url = f"{DAILYDEV_SEARCH_URL}?q={quote(topic)}&limit={limit}"
+    params = {"q": topic, "limit": limit}
 
-    return http.get(url, headers=headers, timeout=30)
+    return http.get(DAILYDEV_SEARCH_URL, headers=headers, params=params, timeout=30)
+
+
+def _engagement_score(post: dict) -> float:
+    """Normalized 0-1 engagement score for a daily.dev post.
+
+    Args:
+        post: Raw post dict
+
+    Returns:
+        Engagement score 0.0-1.0
+    """
+    # API uses numUpvotes/numComments
+    upvotes = post.get("numUpvotes", 0) or post.get("upvotes", 0) or 0
+    comments = post.get("numComments", 0) or post.get("comments", 0) or 0
+    read_time = min(post.get("readTime", 0) or 0, 20)
+
+    eng_score = 0.55 * math.log1p(upvotes) + 0.40 * math.log1p(comments) + 0.05 * (read_time / 20)
+
+    # Normalize to 0-1 range (rough scale based on typical values)
+    # log1p(100) ~ 4.6, log1p(500) ~ 6.2 — cap at ~7 for normalization
+    return min(1.0, eng_score / 7.0)
 
 
 def _compute_relevance(position: int, total: int, post: dict) -> float:
@@ -76,22 +96,7 @@ def _compute_relevance(position: int, total: int, post: dict) -> float:
     else:
         pos_score = max(0.1, 1.0 - (position / (total - 1)) * 0.9)
 
-    # Engagement score (API uses numUpvotes/numComments)
-    upvotes = post.get("numUpvotes", 0) or post.get("upvotes", 0) or 0
-    comments = post.get("numComments", 0) or post.get("comments", 0) or 0
-    read_time = min(post.get("readTime", 0) or 0, 20)
-
-    eng_score = (
-        0.55 * math.log1p(upvotes) +
-        0.40 * math.log1p(comments) +
-        0.05 * (read_time / 20)
-    )
-
-    # Normalize engagement to 0-1 range (rough scale based on typical values)
-    # log1p(100) ~ 4.6, log1p(500) ~ 6.2 — cap at ~7 for normalization
-    eng_normalized = min(1.0, eng_score / 7.0)
-
-    return 0.5 * pos_score + 0.5 * eng_normalized
+    return 0.5 * pos_score + 0.5 * _engagement_score(post)
 
 
 def parse_dailydev_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -104,24 +109,34 @@ def parse_dailydev_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         List of normalized item dicts
     """
     # API returns posts in 'data' array (or 'posts' for mock/legacy)
-    posts = response.get("data", []) or response.get("posts", [])
-    if not posts:
+    posts = response.get("data") or response.get("posts")
+    if not posts or not isinstance(posts, list):
         return []
 
     items = []
+    items_append = items.append
+    # Position score steps from 1.0 (first) down to a 0.1 floor (last);
+    # same formula as _compute_relevance with the step hoisted out of the loop
     total = len(posts)
+    step = 0.9 / (total - 1) if total > 1 else 0.0
+    seen_urls = set()
 
     for i, post in enumerate(posts):
         if not isinstance(post, dict):
             continue
 
-        post_id = post.get("id", f"DD{i+1}")
         title = post.get("title", "").strip()
         url = post.get("url", "").strip()
 
         if not title or not url:
             continue
 
+        # Overlapping result pages can repeat a post; keep the first (best-ranked)
+        url_key = url.split("?", 1)[0].rstrip("/").lower()
+        if url_key in seen_urls:
+            continue
+        seen_urls.add(url_key)
+
         # Parse date — prefer publishedAt over createdAt
         date_str = None
         pub_date = post.get("publishedAt", "") or post.get("createdAt", "")
@@ -155,9 +170,10 @@ def parse_dailydev_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         read_time = post.get("readTime")
 
         # Relevance
-        relevance = _compute_relevance(i, total, post)
+        pos_score = max(0.1, 1.0 - i * step)
+        relevance = 0.5 * pos_score + 0.5 * _engagement_score(post)
 
-        items.append({
+        items_append({
             "id": f"DD{i+1}",
             "title": title,
             "url": url,
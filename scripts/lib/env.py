@@ -2,6 +2,8 @@
 
 import json
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -21,68 +23,102 @@ else:
     CONFIG_FILE = CONFIG_DIR / ".env"
 
 
-def load_env_file(path: Path) -> Dict[str, str]:
-    """Load environment variables from a file."""
+# Keys get_config reads from the environment / config file, with the
+# default used when neither sets them (order matches the config dict)
+_CONFIG_DEFAULTS = (
+    ('OPENAI_API_KEY', None),
+    ('TWITTERAPI_IO_KEY', None),
+    ('XAI_API_KEY', None),
+    ('OPENAI_MODEL_POLICY', 'auto'),
+    ('OPENAI_MODEL_PIN', None),
+    ('DAILYDEV_API_KEY', None),
+    ('TUBELAB_API_KEY', None),
+    ('OPENROUTER_API_KEY', None),
+    ('PARALLEL_API_KEY', None),
+    ('BRAVE_API_KEY', None),
+)
+_CONFIG_KEYS = tuple(key for key, _ in _CONFIG_DEFAULTS)
+
+
+def _file_mtime(path: Optional[Path]) -> Optional[int]:
+    """Return the file's mtime in ns, or None if it doesn't exist."""
+    if path is None:
+        return None
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+# One KEY=value assignment per line; blank and '#' comment lines never match
+_ENV_LINE_RE = re.compile(r'^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+
+@lru_cache(maxsize=8)
+def _read_env_file(path: Path, mtime_ns: int) -> Dict[str, str]:
+    """Parse an env file. Cached per (path, mtime) so edits are picked up."""
     env = {}
-    if not path.exists():
-        return env
-
-    with open(path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' in line:
-                key, _, value = line.partition('=')
-                key = key.strip()
-                value = value.strip()
-                # Remove quotes if present
-                if value and value[0] in ('"', "'") and value[-1] == value[0]:
-                    value = value[1:-1]
-                if key and value:
-                    env[key] = value
+    for match in _ENV_LINE_RE.finditer(path.read_text()):
+        key, value = match.groups()
+        # Remove quotes if present
+        if value and value[0] in ('"', "'") and value[-1] == value[0]:
+            value = value[1:-1]
+        if value:
+            env[key] = value
     return env
 
 
+def load_env_file(path: Path) -> Dict[str, str]:
+    """Load environment variables from a file."""
+    mtime_ns = _file_mtime(path)
+    if mtime_ns is None:
+        return {}
+    return dict(_read_env_file(path, mtime_ns))
+
+
 def get_config() -> Dict[str, Any]:
     """Load configuration from ~/.config/last30days/.env and environment."""
+    env_values = tuple(os.environ.get(key) for key in _CONFIG_KEYS)
+    return dict(_build_config(CONFIG_FILE, _file_mtime(CONFIG_FILE), env_values))
+
+
+@lru_cache(maxsize=8)
+def _build_config(
+    config_file: Optional[Path],
+    file_mtime: Optional[int],
+    env_values: tuple,
+) -> Dict[str, Any]:
+    """Assemble the config dict. Cached on config file + mtime + env values."""
+    environ = dict(zip(_CONFIG_KEYS, env_values))
+
     # Load from config file first (if configured)
-    file_env = load_env_file(CONFIG_FILE) if CONFIG_FILE else {}
+    file_env = _read_env_file(config_file, file_mtime) if file_mtime is not None else {}
+
+    # Environment variables override file
+    if file_env:
+        config = {key: environ[key] or file_env.get(key, default) for key, default in _CONFIG_DEFAULTS}
+    else:
+        config = {key: environ[key] or default for key, default in _CONFIG_DEFAULTS}
 
     # Resolve twitterapi.io key (new name) with XAI_API_KEY fallback
-    twitterapi_key = (
-        os.environ.get('TWITTERAPI_IO_KEY')
-        or file_env.get('TWITTERAPI_IO_KEY')
-        or os.environ.get('XAI_API_KEY')
-        or file_env.get('XAI_API_KEY')
-    )
+    has_new_key = bool(config['TWITTERAPI_IO_KEY'])
+    has_old_xai_key = bool(config['XAI_API_KEY'])
+    twitterapi_key = config['TWITTERAPI_IO_KEY'] or config['XAI_API_KEY']
+    config['TWITTERAPI_IO_KEY'] = twitterapi_key
+    config['XAI_API_KEY'] = twitterapi_key  # Alias for get_available_sources() compat
 
     # Detect migration scenario: user has old key name but not new one
-    has_old_xai_key = bool(
-        os.environ.get('XAI_API_KEY') or file_env.get('XAI_API_KEY')
-    )
-    has_new_key = bool(
-        os.environ.get('TWITTERAPI_IO_KEY') or file_env.get('TWITTERAPI_IO_KEY')
-    )
-
-    # Environment variables override file
-    config = {
-        'OPENAI_API_KEY': os.environ.get('OPENAI_API_KEY') or file_env.get('OPENAI_API_KEY'),
-        'TWITTERAPI_IO_KEY': twitterapi_key,
-        'XAI_API_KEY': twitterapi_key,  # Alias for get_available_sources() compat
-        'OPENAI_MODEL_POLICY': os.environ.get('OPENAI_MODEL_POLICY') or file_env.get('OPENAI_MODEL_POLICY', 'auto'),
-        'OPENAI_MODEL_PIN': os.environ.get('OPENAI_MODEL_PIN') or file_env.get('OPENAI_MODEL_PIN'),
-        'DAILYDEV_API_KEY': os.environ.get('DAILYDEV_API_KEY') or file_env.get('DAILYDEV_API_KEY'),
-        'TUBELAB_API_KEY': os.environ.get('TUBELAB_API_KEY') or file_env.get('TUBELAB_API_KEY'),
-        'OPENROUTER_API_KEY': os.environ.get('OPENROUTER_API_KEY') or file_env.get('OPENROUTER_API_KEY'),
-        'PARALLEL_API_KEY': os.environ.get('PARALLEL_API_KEY') or file_env.get('PARALLEL_API_KEY'),
-        'BRAVE_API_KEY': os.environ.get('BRAVE_API_KEY') or file_env.get('BRAVE_API_KEY'),
-        '_HAS_OLD_XAI_KEY': has_old_xai_key and not has_new_key,
-    }
+    config['_HAS_OLD_XAI_KEY'] = has_old_xai_key and not has_new_key
 
     return config
 
 
+def reset_cache():
+    """Drop cached env file parses and config (for tests)."""
+    _read_env_file.cache_clear()
+    _build_config.cache_clear()
+
+
 def config_exists() -> bool:
     """Check if configuration file exists."""
     return CONFIG_FILE.exists()
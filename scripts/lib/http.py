@@ -1,13 +1,16 @@
 """HTTP utilities for last30days skill (stdlib only)."""
 
+import http.client
 import json
 import os
+import ssl
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit
 
 DEFAULT_TIMEOUT = 30
 DEBUG = os.environ.get("LAST30DAYS_DEBUG", "").lower() in ("1", "true", "yes")
@@ -22,6 +25,21 @@ MAX_RETRIES = 3
 RETRY_DELAY = 1.0
 USER_AGENT = "last30days-skill/2.1 (Assistant Skill)"
 
+# Keep-alive connection pool (one idle list per scheme+host)
+POOL_MAX_PER_HOST = 8
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+_pool: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+
+# http.client ignores proxy settings, so fall back to urlopen when one is set
+# for the request's scheme (a lone NO_PROXY shows up here as a "no" entry)
+_PROXIES = urllib.request.getproxies()
+
+# One TLS context for every HTTPS connection; building one loads the CA store
+_ssl_context: Optional[ssl.SSLContext] = None
+
 
 class HTTPError(Exception):
     """HTTP request error with status code."""
@@ -31,6 +49,132 @@ class HTTPError(Exception):
         self.body = body
 
 
+def _get_ssl_context() -> ssl.SSLContext:
+    """Return the shared TLS context, creating it on first use."""
+    global _ssl_context
+    if _ssl_context is None:
+        with _pool_lock:
+            if _ssl_context is None:
+                _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+def _get_connection(scheme: str, netloc: str, timeout: int, fresh: bool = False) -> Tuple[http.client.HTTPConnection, bool]:
+    """Take an idle pooled connection for scheme+host, or open a new one.
+
+    Returns:
+        Tuple of (connection, reused)
+    """
+    conn = None
+    if not fresh:
+        with _pool_lock:
+            idle = _pool.get((scheme, netloc))
+            if idle:
+                conn = idle.pop()
+
+    if conn is None:
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=timeout, context=_get_ssl_context()), False
+        return http.client.HTTPConnection(netloc, timeout=timeout), False
+
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _release_connection(scheme: str, netloc: str, conn: http.client.HTTPConnection):
+    """Return a connection to the pool, closing it if the pool is full."""
+    with _pool_lock:
+        idle = _pool.setdefault((scheme, netloc), [])
+        if len(idle) < POOL_MAX_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _roundtrip(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: int,
+) -> Tuple[int, str, Any, bytes]:
+    """Send one request over a pooled keep-alive connection.
+
+    Returns:
+        Tuple of (status, reason, response headers, body bytes)
+    """
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    conn, reused = _get_connection(parts.scheme, parts.netloc, timeout)
+    while True:
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            break
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            # Server dropped the idle keep-alive connection; retry on a new one
+            conn, reused = _get_connection(parts.scheme, parts.netloc, timeout, fresh=True)
+        except BaseException:
+            conn.close()
+            raise
+
+    if response.will_close:
+        conn.close()
+    else:
+        _release_connection(parts.scheme, parts.netloc, conn)
+
+    return response.status, response.reason, response.headers, body
+
+
+def _send(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: int,
+) -> Tuple[int, str, bytes]:
+    """Send a request, following redirects the same way urlopen does.
+
+    Returns:
+        Tuple of (status, reason, body bytes)
+    """
+    if _PROXIES and url.split(":", 1)[0].lower() in _PROXIES:
+        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                return response.status, response.reason, response.read()
+        except urllib.error.HTTPError as e:
+            try:
+                body = e.read()
+            except Exception:
+                body = b""
+            return e.code, e.reason, body
+
+    for _ in range(MAX_REDIRECTS + 1):
+        status, reason, resp_headers, body = _roundtrip(method, url, headers, data, timeout)
+        location = resp_headers.get("Location")
+        if status not in REDIRECT_CODES or not location:
+            return status, reason, body
+
+        url = urljoin(url, location)
+        log(f"Redirect {status} -> {url}")
+        if status in (301, 302, 303) and method not in ("GET", "HEAD"):
+            method = "GET"
+            data = None
+            headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+
+    return status, reason, body
+
+
 def request(
     method: str,
     url: str,
@@ -38,6 +182,7 @@ def request(
     json_data: Optional[Dict[str, Any]] = None,
     timeout: int = DEFAULT_TIMEOUT,
     retries: int = MAX_RETRIES,
+    params: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Make an HTTP request and return JSON response.
 
@@ -48,6 +193,7 @@ def request(
         json_data: Optional JSON body (for POST)
         timeout: Request timeout in seconds
         retries: Number of retries on failure
+        params: Optional query parameters (percent-encoded and appended to url)
 
     Returns:
         Parsed JSON response
@@ -55,6 +201,9 @@ def request(
     Raises:
         HTTPError: On request failure
     """
+    if params:
+        url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+
     headers = headers or {}
     headers.setdefault("User-Agent", USER_AGENT)
 
@@ -63,8 +212,6 @@ def request(
         data = json.dumps(json_data).encode('utf-8')
         headers.setdefault("Content-Type", "application/json")
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-
     log(f"{method} {url}")
     if json_data:
         log(f"Payload keys: {list(json_data.keys())}")
@@ -72,42 +219,36 @@ def request(
     last_error = None
     for attempt in range(retries):
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                body = response.read().decode('utf-8')
-                log(f"Response: {response.status} ({len(body)} bytes)")
-                return json.loads(body) if body else {}
-        except urllib.error.HTTPError as e:
-            body = None
-            try:
-                body = e.read().decode('utf-8')
-            except:
-                pass
-            log(f"HTTP Error {e.code}: {e.reason}")
-            if body:
-                log(f"Error body: {body[:500]}")
-            last_error = HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body)
-
-            # Don't retry client errors (4xx) except rate limits
-            if 400 <= e.code < 500 and e.code != 429:
-                raise last_error
-
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+            status, reason, raw = _send(method, url, headers, data, timeout)
         except urllib.error.URLError as e:
             log(f"URL Error: {e.reason}")
             last_error = HTTPError(f"URL Error: {e.reason}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-        except json.JSONDecodeError as e:
-            log(f"JSON decode error: {e}")
-            last_error = HTTPError(f"Invalid JSON response: {e}")
-            raise last_error
-        except (OSError, TimeoutError, ConnectionResetError) as e:
+        except (OSError, http.client.HTTPException) as e:
             # Handle socket-level errors (connection reset, timeout, etc.)
             log(f"Connection error: {type(e).__name__}: {e}")
             last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+        else:
+            if status < 400:
+                body = raw.decode('utf-8')
+                log(f"Response: {status} ({len(body)} bytes)")
+                try:
+                    return json.loads(body) if body else {}
+                except json.JSONDecodeError as e:
+                    log(f"JSON decode error: {e}")
+                    raise HTTPError(f"Invalid JSON response: {e}")
+
+            body = raw.decode('utf-8', errors='replace') or None
+            log(f"HTTP Error {status}: {reason}")
+            if body:
+                log(f"Error body: {body[:500]}")
+            last_error = HTTPError(f"HTTP {status}: {reason}", status, body)
+
+            # Don't retry client errors (4xx) except rate limits
+            if 400 <= status < 500 and status != 429:
+                raise last_error
+
+        if attempt < retries - 1:
+            time.sleep(RETRY_DELAY * (attempt + 1))
 
     if last_error:
         raise last_error
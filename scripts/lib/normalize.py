@@ -62,46 +62,56 @@ def normalize_reddit_items(
     Returns:
         List of RedditItem objects
     """
+    # Hoist module attribute lookups out of the per-item loop
+    Engagement = schema.Engagement
+    Comment = schema.Comment
+    RedditItem = schema.RedditItem
+    get_date_confidence = dates.get_date_confidence
+
     normalized = []
+    append = normalized.append
 
     for item in items:
+        get = item.get
+
         # Parse engagement
         engagement = None
-        eng_raw = item.get("engagement")
+        eng_raw = get("engagement")
         if isinstance(eng_raw, dict):
-            engagement = schema.Engagement(
+            engagement = Engagement(
                 score=eng_raw.get("score"),
                 num_comments=eng_raw.get("num_comments"),
                 upvote_ratio=eng_raw.get("upvote_ratio"),
             )
 
         # Parse comments
-        top_comments = []
-        for c in item.get("top_comments", []):
-            top_comments.append(schema.Comment(
+        top_comments = [
+            Comment(
                 score=c.get("score", 0),
                 date=c.get("date"),
                 author=c.get("author", ""),
                 excerpt=c.get("excerpt", ""),
                 url=c.get("url", ""),
-            ))
+            )
+            for c in get("top_comments", [])
+        ]
 
         # Determine date confidence
-        date_str = item.get("date")
-        date_confidence = dates.get_date_confidence(date_str, from_date, to_date)
-
-        normalized.append(schema.RedditItem(
-            id=item.get("id", ""),
-            title=item.get("title", ""),
-            url=item.get("url", ""),
-            subreddit=item.get("subreddit", ""),
+        date_str = get("date")
+        date_confidence = get_date_confidence(date_str, from_date, to_date)
+
+        append(RedditItem(
+            id=get("id", ""),
+            title=get("title", ""),
+            url=get("url", ""),
+            subreddit=get("subreddit", ""),
             date=date_str,
             date_confidence=date_confidence,
             engagement=engagement,
             top_comments=top_comments,
-            comment_insights=item.get("comment_insights", []),
-            relevance=item.get("relevance", 0.5),
-            why_relevant=item.get("why_relevant", ""),
+            comment_insights=get("comment_insights", []),
+            relevance=get("relevance", 0.5),
+            why_relevant=get("why_relevant", ""),
         ))
 
     return normalized
@@ -122,14 +132,22 @@ def normalize_x_items(
     Returns:
         List of XItem objects
     """
+    # Hoist module attribute lookups out of the per-item loop
+    Engagement = schema.Engagement
+    XItem = schema.XItem
+    get_date_confidence = dates.get_date_confidence
+
     normalized = []
+    append = normalized.append
 
     for item in items:
+        get = item.get
+
         # Parse engagement
         engagement = None
-        eng_raw = item.get("engagement")
+        eng_raw = get("engagement")
         if isinstance(eng_raw, dict):
-            engagement = schema.Engagement(
+            engagement = Engagement(
                 likes=eng_raw.get("likes"),
                 reposts=eng_raw.get("reposts"),
                 replies=eng_raw.get("replies"),
@@ -137,19 +155,19 @@ def normalize_x_items(
             )
 
         # Determine date confidence
-        date_str = item.get("date")
-        date_confidence = dates.get_date_confidence(date_str, from_date, to_date)
-
-        normalized.append(schema.XItem(
-            id=item.get("id", ""),
-            text=item.get("text", ""),
-            url=item.get("url", ""),
-            author_handle=item.get("author_handle", ""),
+        date_str = get("date")
+        date_confidence = get_date_confidence(date_str, from_date, to_date)
+
+        append(XItem(
+            id=get("id", ""),
+            text=get("text", ""),
+            url=get("url", ""),
+            author_handle=get("author_handle", ""),
             date=date_str,
             date_confidence=date_confidence,
             engagement=engagement,
-            relevance=item.get("relevance", 0.5),
-            why_relevant=item.get("why_relevant", ""),
+            relevance=get("relevance", 0.5),
+            why_relevant=get("why_relevant", ""),
         ))
 
     return normalized
@@ -1,11 +1,11 @@
 """OpenAI Responses API client for Reddit discovery."""
 
 import json
-import re
 import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
-from . import http
+from . import http, score
 
 # Fallback models when the selected model isn't accessible (e.g., org not verified for GPT-5)
 MODEL_FALLBACK_ORDER = ["gpt-4.1", "gpt-4o", "gpt-4o-mini"]
@@ -93,15 +93,25 @@ Return JSON:
 }}"""
 
 
+# Filler words stripped by _extract_core_subject
+NOISE_WORDS = frozenset({
+    'best', 'top', 'how', 'to', 'tips', 'for', 'practices', 'features',
+    'killer', 'guide', 'tutorial', 'recommendations', 'advice',
+    'prompting', 'using', 'with', 'the', 'of', 'in', 'on', 'and',
+    'hour', 'day', 'setup', 'workflow', 'most', 'popular', 'what',
+    'are', 'is', 'my', 'your', 'a', 'an',
+})
+
+
+@lru_cache(maxsize=1024)
 def _extract_core_subject(topic: str) -> str:
-    """Extract core subject from verbose query for retry."""
-    noise = ['best', 'top', 'how', 'to', 'tips', 'for', 'practices', 'features',
-             'killer', 'guide', 'tutorial', 'recommendations', 'advice',
-             'prompting', 'using', 'with', 'the', 'of', 'in', 'on', 'and',
-             'hour', 'day', 'setup', 'workflow', 'most', 'popular', 'what',
-             'are', 'is', 'my', 'your', 'a', 'an']
+    """Extract core subject from verbose query for retry.
+
+    Cached: the same topic is reduced for the Reddit retry, the X retry,
+    the subreddit fallback and Phase 2 supplemental search.
+    """
     words = topic.lower().split()
-    result = [w for w in words if w not in noise and not w.isdigit()]
+    result = [w for w in words if w not in NOISE_WORDS and not w.isdigit()]
     return ' '.join(result[:3]) or topic  # Keep max 3 words
 
 
@@ -284,6 +294,57 @@ def _url_encode(text: str) -> str:
     return urllib.parse.quote_plus(text)
 
 
+# Accepted thread URL prefixes; a prefix check also rejects look-alike hosts
+# such as reddit.com.example.net that a substring test would let through
+_REDDIT_URL_PREFIXES = tuple(
+    f"{scheme}://{host}reddit.com/"
+    for scheme in ("https", "http")
+    for host in ("", "www.", "old.", "new.", "np.", "m.")
+)
+
+
+# Stdlib decoder on purpose: raw_decode lets _extract_items_json parse in
+# place at an offset, which the faster third-party parsers don't offer.
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _is_iso_date(value: Any) -> bool:
+    """Check for a YYYY-MM-DD string with fixed-position character tests."""
+    return (
+        isinstance(value, str)
+        and len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and (value[:4] + value[5:7] + value[8:]).isdigit()
+    )
+
+
+def _extract_items_json(text: str) -> Optional[Dict[str, Any]]:
+    """Find the first JSON object with an "items" key embedded in text.
+
+    Decodes in place from each candidate '{' with raw_decode, so the scan
+    is linear in the common case and never copies out a substring.
+
+    Args:
+        text: Model output text
+
+    Returns:
+        Decoded object, or None if no object with "items" is found
+    """
+    pos = text.find('{')
+    while pos != -1:
+        try:
+            obj, end = _JSON_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            pos = text.find('{', pos + 1)
+            continue
+        if isinstance(obj, dict) and "items" in obj:
+            return obj
+        # Skip past this complete object
+        pos = text.find('{', end)
+    return None
+
+
 def parse_reddit_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Parse OpenAI response to extract Reddit items.
 
@@ -338,39 +399,45 @@ def parse_reddit_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         return items
 
     # Extract JSON from the response
-    json_match = re.search(r'\{[\s\S]*"items"[\s\S]*\}', output_text)
-    if json_match:
-        try:
-            data = json.loads(json_match.group())
-            items = data.get("items", [])
-        except json.JSONDecodeError:
-            pass
+    data = _extract_items_json(output_text)
+    if data:
+        items = data.get("items") or []
 
-    # Validate and clean items
+    # Validate and clean items (one .get per field, str() only when needed)
     clean_items = []
+    seen_threads = set()
     for i, item in enumerate(items):
         if not isinstance(item, dict):
             continue
+        get = item.get
 
-        url = item.get("url", "")
-        if not url or "reddit.com" not in url:
+        url = get("url", "")
+        if not isinstance(url, str) or not url.startswith(_REDDIT_URL_PREFIXES):
             continue
 
-        clean_item = {
-            "id": f"R{i+1}",
-            "title": str(item.get("title", "")).strip(),
-            "url": url,
-            "subreddit": str(item.get("subreddit", "")).strip().lstrip("r/"),
-            "date": item.get("date"),
-            "why_relevant": str(item.get("why_relevant", "")).strip(),
-            "relevance": min(1.0, max(0.0, float(item.get("relevance", 0.5)))),
-        }
+        # Same thread under another host/casing/query string: keep the first
+        thread_key = url.split("reddit.com", 1)[1].split("?", 1)[0].rstrip("/").lower()
+        if thread_key in seen_threads:
+            continue
+        seen_threads.add(thread_key)
 
-        # Validate date format
-        if clean_item["date"]:
-            if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(clean_item["date"])):
-                clean_item["date"] = None
+        title = get("title", "")
+        subreddit = get("subreddit", "")
+        why_relevant = get("why_relevant", "")
 
-        clean_items.append(clean_item)
+        # Validate date format (YYYY-MM-DD)
+        date = get("date")
+        if date and not _is_iso_date(date):
+            date = None
+
+        clean_items.append({
+            "id": f"R{i+1}",
+            "title": (title if isinstance(title, str) else str(title)).strip(),
+            "url": url,
+            "subreddit": (subreddit if isinstance(subreddit, str) else str(subreddit)).strip().lstrip("r/"),
+            "date": date,
+            "why_relevant": (why_relevant if isinstance(why_relevant, str) else str(why_relevant)).strip(),
+            "relevance": score.clamp01(float(get("relevance", 0.5))),
+        })
 
     return clean_items
@@ -0,0 +1,58 @@
+"""Per-source processing pipeline for last30days skill.
+
+Raw items from each source go through the same stages:
+normalize -> hard date filter -> score -> sort -> dedupe
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from . import dedupe, normalize, score, websearch
+
+# kind -> (normalize_fn, score_fn, dedupe_fn, apply_date_filter)
+_STAGES = {
+    "reddit": (normalize.normalize_reddit_items, score.score_reddit_items, dedupe.dedupe_reddit, True),
+    "x": (normalize.normalize_x_items, score.score_x_items, dedupe.dedupe_x, True),
+    "dailydev": (normalize.normalize_dailydev_items, score.score_dailydev_items, dedupe.dedupe_dailydev, True),
+    # YouTube: skip hard date filter -- youtube_yt.py already applies a soft filter
+    # that prefers recent videos but keeps older ones for evergreen topics.
+    "youtube": (normalize.normalize_youtube_items, score.score_youtube_items, dedupe.dedupe_youtube, False),
+    "web": (websearch.normalize_websearch_items, score.score_websearch_items, websearch.dedupe_websearch, True),
+}
+
+
+def process_source(
+    items: List[Dict[str, Any]],
+    from_date: str,
+    to_date: str,
+    kind: str,
+) -> Tuple[List, List]:
+    """Run one source's raw items through every processing stage.
+
+    Scoring normalizes engagement across the whole list and dedupe compares
+    items pairwise, so the stages run list-at-a-time rather than per item.
+
+    Args:
+        items: Raw item dicts from the source
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        kind: 'reddit', 'x', 'dailydev', 'youtube', or 'web'
+
+    Returns:
+        Tuple of (normalized, processed) where normalized is the full
+        pre-filter list and processed is scored, sorted and deduped
+    """
+    if not items:
+        return [], []
+
+    normalize_fn, score_fn, dedupe_fn, apply_date_filter = _STAGES[kind]
+
+    normalized = normalize_fn(items, from_date, to_date)
+
+    # Hard date filter: exclude items with verified dates outside the range
+    # This is the safety net - even if prompts let old content through, this filters it
+    if apply_date_filter:
+        filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+    else:
+        filtered = normalized
+
+    return normalized, dedupe_fn(score.sort_items(score_fn(filtered)))
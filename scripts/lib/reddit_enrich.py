@@ -25,6 +25,32 @@ def extract_reddit_path(url: str) -> Optional[str]:
         return None
 
 
+REDDIT_INFO_URL = "https://www.reddit.com/api/info.json"
+
+# /api/info accepts at most 100 fullnames per request
+INFO_BATCH_SIZE = 100
+
+_THREAD_ID_RE = re.compile(r'/comments/([a-z0-9]+)', re.IGNORECASE)
+
+
+def extract_thread_fullname(url: str) -> Optional[str]:
+    """Extract the submission fullname (t3_<id>) from a Reddit thread URL.
+
+    Args:
+        url: Reddit thread URL
+
+    Returns:
+        Fullname like 't3_abc123' or None
+    """
+    path = extract_reddit_path(url)
+    if not path:
+        return None
+    match = _THREAD_ID_RE.search(path)
+    if not match:
+        return None
+    return f"t3_{match.group(1).lower()}"
+
+
 class RedditRateLimitError(Exception):
     """Raised when Reddit returns HTTP 429 (rate limited)."""
     pass
@@ -66,6 +92,55 @@ def fetch_thread_data(
         return None
 
 
+def fetch_submissions_batch(
+    fullnames: List[str],
+    timeout: int = 10,
+    retries: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch submission data for many threads via /api/info.
+
+    Issues one request per INFO_BATCH_SIZE fullnames. A chunk that fails
+    is skipped; its threads are simply missing from the result.
+
+    Args:
+        fullnames: Submission fullnames (t3_<id>)
+        timeout: HTTP timeout per attempt in seconds
+        retries: Number of retries on failure
+
+    Returns:
+        Dict mapping fullname to raw submission data
+
+    Raises:
+        RedditRateLimitError: When Reddit returns 429 (caller should bail)
+    """
+    headers = {
+        "User-Agent": http.USER_AGENT,
+        "Accept": "application/json",
+    }
+    submissions = {}
+
+    for start in range(0, len(fullnames), INFO_BATCH_SIZE):
+        chunk = fullnames[start:start + INFO_BATCH_SIZE]
+        params = {"id": ",".join(chunk), "raw_json": 1}
+        try:
+            data = http.get(REDDIT_INFO_URL, headers=headers, params=params,
+                            timeout=timeout, retries=retries)
+        except http.HTTPError as e:
+            if e.status_code == 429:
+                raise RedditRateLimitError("Reddit rate limited (429) fetching /api/info") from e
+            continue
+
+        for child in data.get("data", {}).get("children", []):
+            if child.get("kind") != "t3":
+                continue
+            sub_data = child.get("data", {})
+            name = sub_data.get("name")
+            if name:
+                submissions[name] = sub_data
+
+    return submissions
+
+
 def parse_thread_data(data: Any) -> Dict[str, Any]:
     """Parse Reddit thread JSON into structured data.
 
@@ -192,6 +267,65 @@ def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
     return insights
 
 
+def _apply_submission(item: Dict[str, Any], submission: Dict[str, Any]):
+    """Copy real engagement metrics and date from submission data onto an item."""
+    item["engagement"] = {
+        "score": submission.get("score"),
+        "num_comments": submission.get("num_comments"),
+        "upvote_ratio": submission.get("upvote_ratio"),
+    }
+
+    # Update date from actual data
+    created_utc = submission.get("created_utc")
+    if created_utc:
+        item["date"] = dates.timestamp_to_date(created_utc)
+
+
+def enrich_reddit_items_batch(
+    items: List[Dict[str, Any]],
+    mock_submissions: Optional[Dict[str, Dict]] = None,
+    timeout: int = 10,
+    retries: int = 1,
+) -> List[Dict[str, Any]]:
+    """Enrich many Reddit items with real engagement data in bulk.
+
+    Uses /api/info, so one request covers up to 100 threads. Only submission
+    metrics are available this way (no comments); use enrich_reddit_item
+    when top comments are needed.
+
+    Args:
+        items: Reddit item dicts (updated in place)
+        mock_submissions: Mock fullname -> submission data for testing
+        timeout: HTTP timeout per attempt (default 10s for enrichment)
+        retries: Number of retries (default 1 — fail fast for enrichment)
+
+    Returns:
+        The same list of items
+
+    Raises:
+        RedditRateLimitError: Propagated so caller can stop enriching
+    """
+    by_fullname: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items:
+        fullname = extract_thread_fullname(item.get("url", ""))
+        if fullname:
+            by_fullname.setdefault(fullname, []).append(item)
+
+    if not by_fullname:
+        return items
+
+    if mock_submissions is not None:
+        submissions = mock_submissions
+    else:
+        submissions = fetch_submissions_batch(list(by_fullname), timeout=timeout, retries=retries)
+
+    for fullname, submission in submissions.items():
+        for item in by_fullname.get(fullname, ()):
+            _apply_submission(item, submission)
+
+    return items
+
+
 def enrich_reddit_item(
     item: Dict[str, Any],
     mock_thread_data: Optional[Dict] = None,
@@ -225,16 +359,7 @@ def enrich_reddit_item(
 
     # Update engagement metrics
     if submission:
-        item["engagement"] = {
-            "score": submission.get("score"),
-            "num_comments": submission.get("num_comments"),
-            "upvote_ratio": submission.get("upvote_ratio"),
-        }
-
-        # Update date from actual data
-        created_utc = submission.get("created_utc")
-        if created_utc:
-            item["date"] = dates.timestamp_to_date(created_utc)
+        _apply_submission(item, submission)
 
     # Get top comments
     top_comments = get_top_comments(comments)
@@ -1,11 +1,16 @@
 """Data schemas for last30days skill."""
 
+import sys
 from dataclasses import dataclass, field, asdict
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
+# Per-item classes use __slots__ where dataclasses support it (3.10+), which
+# drops the per-instance __dict__. Older Pythons get regular dataclasses.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Engagement:
     """Engagement metrics."""
     # Reddit fields
@@ -43,7 +48,7 @@ class Engagement:
         return d if d else None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Comment:
     """Reddit comment."""
     score: int
@@ -77,7 +82,7 @@ class SubScores:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RedditItem:
     """Normalized Reddit item."""
     id: str
@@ -112,7 +117,7 @@ class RedditItem:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class XItem:
     """Normalized X item."""
     id: str
@@ -31,6 +31,13 @@ def log1p_safe(x: Optional[int]) -> float:
     return math.log1p(x)
 
 
+def clamp01(x: float) -> float:
+    """Clamp a score to [0.0, 1.0]. NaN maps to 0.0."""
+    if 0.0 <= x <= 1.0:
+        return x
+    return 1.0 if x > 1.0 else 0.0
+
+
 def compute_reddit_engagement_raw(engagement: Optional[schema.Engagement]) -> Optional[float]:
     """Compute raw engagement score for Reddit item.
 
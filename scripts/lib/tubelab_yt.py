@@ -55,6 +55,27 @@ def search_youtube(
     return http.get(url, headers=headers, timeout=30)
 
 
+def _engagement_score(video: dict) -> float:
+    """Normalized 0-1 engagement score for a YouTube video.
+
+    Args:
+        video: Raw video dict
+
+    Returns:
+        Engagement score 0.0-1.0
+    """
+    # Views-dominant for YouTube
+    views = video.get("views", 0) or 0
+    likes = video.get("likes", 0) or 0
+    comments = video.get("comments", 0) or 0
+
+    eng_score = 0.50 * math.log1p(views) + 0.30 * math.log1p(likes) + 0.20 * math.log1p(comments)
+
+    # Normalize to 0-1 range
+    # log1p(100000) ~ 11.5, log1p(1000000) ~ 13.8 — cap at ~14
+    return min(1.0, eng_score / 14.0)
+
+
 def _compute_relevance(position: int, total: int, video: dict) -> float:
     """Compute relevance score for a YouTube video.
 
@@ -74,22 +95,7 @@ def _compute_relevance(position: int, total: int, video: dict) -> float:
     else:
         pos_score = max(0.1, 1.0 - (position / (total - 1)) * 0.9)
 
-    # Engagement score (views-dominant for YouTube)
-    views = video.get("views", 0) or 0
-    likes = video.get("likes", 0) or 0
-    comments = video.get("comments", 0) or 0
-
-    eng_score = (
-        0.50 * math.log1p(views) +
-        0.30 * math.log1p(likes) +
-        0.20 * math.log1p(comments)
-    )
-
-    # Normalize engagement to 0-1 range
-    # log1p(100000) ~ 11.5, log1p(1000000) ~ 13.8 — cap at ~14
-    eng_normalized = min(1.0, eng_score / 14.0)
-
-    return 0.4 * pos_score + 0.6 * eng_normalized
+    return 0.4 * pos_score + 0.6 * _engagement_score(video)
 
 
 def parse_youtube_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -107,6 +113,7 @@ def parse_youtube_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
 
     items = []
     total = len(videos)
+    seen_ids = set()
 
     for i, video in enumerate(videos):
         if not isinstance(video, dict):
@@ -118,6 +125,11 @@ def parse_youtube_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         if not title or not video_id:
             continue
 
+        # Keep only the first (best-ranked) copy of a video
+        if video_id in seen_ids:
+            continue
+        seen_ids.add(video_id)
+
         url = f"https://www.youtube.com/watch?v={video_id}"
 
         # Parse date from publishedAt ISO format
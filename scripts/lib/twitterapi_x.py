@@ -1,13 +1,12 @@
 """twitterapi.io client for X (Twitter) discovery."""
 
+import calendar
 import math
-import re
 import sys
-from datetime import datetime
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
-from . import http
+from . import http, score
 
 
 def _log_error(msg: str):
@@ -25,6 +24,12 @@ DEPTH_CONFIG = {
     "deep": (2, 3),
 }
 
+# Month abbreviations in Twitter's created_at format
+_MONTHS = {
+    "Jan": "01", "Feb": "02", "Mar": "03", "Apr": "04", "May": "05", "Jun": "06",
+    "Jul": "07", "Aug": "08", "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12",
+}
+
 # Engagement weights (same as score.py)
 ENGAGEMENT_WEIGHTS = {
     "likes": 0.55,
@@ -33,6 +38,13 @@ ENGAGEMENT_WEIGHTS = {
     "quotes": 0.05,
 }
 
+# Flattened weights and reciprocal cap for the per-tweet engagement score
+_W_LIKES = ENGAGEMENT_WEIGHTS["likes"]
+_W_REPOSTS = ENGAGEMENT_WEIGHTS["reposts"]
+_W_REPLIES = ENGAGEMENT_WEIGHTS["replies"]
+_W_QUOTES = ENGAGEMENT_WEIGHTS["quotes"]
+_INV_7 = 1.0 / 7.0
+
 
 def build_query(
     topic: str,
@@ -89,18 +101,16 @@ def search_x(
         "X-API-Key": api_key,
     }
 
+    # Encode the fixed part of the query string once; only the cursor varies
+    base_url = f"{TWITTERAPI_SEARCH_URL}?{urlencode({'query': query, 'queryType': 'Top'})}"
     all_tweets = []
     cursor = None
 
+    # Pages can't be fetched concurrently: each request needs the opaque
+    # next_cursor from the previous response. Overlap comes from running the
+    # whole X search alongside the other sources instead.
     for page in range(max_pages):
-        params = {
-            "query": query,
-            "queryType": "Top",
-        }
-        if cursor:
-            params["cursor"] = cursor
-
-        url = f"{TWITTERAPI_SEARCH_URL}?{urlencode(params)}"
+        url = f"{base_url}&cursor={quote_plus(cursor)}" if cursor else base_url
 
         try:
             response = http.get(url, headers=headers, timeout=30)
@@ -142,21 +152,50 @@ def _parse_created_at(created_at: Any) -> Optional[str]:
 
     created_at = created_at.strip()
 
-    # Try ISO format first
-    iso_match = re.match(r'^(\d{4})-(\d{2})-(\d{2})', created_at)
-    if iso_match:
-        return f"{iso_match.group(1)}-{iso_match.group(2)}-{iso_match.group(3)}"
+    # ISO starts with a digit, Twitter format with a weekday name
+    if created_at[:1].isdigit():
+        date = created_at[:10]
+        if (len(date) == 10 and date[4] == "-" and date[7] == "-"
+                and (date[:4] + date[5:7] + date[8:]).isdigit()):
+            return date
+        return None
 
-    # Try Twitter format: "Wed Jan 15 14:30:00 +0000 2026"
-    try:
-        dt = datetime.strptime(created_at, "%a %b %d %H:%M:%S %z %Y")
-        return dt.strftime("%Y-%m-%d")
-    except ValueError:
-        pass
+    # Twitter format: "Wed Jan 15 14:30:00 +0000 2026"
+    # Only the date fields are needed, so pick them out instead of strptime
+    parts = created_at.split()
+    if len(parts) == 6:
+        month = _MONTHS.get(parts[1])
+        day = parts[2]
+        year = parts[5]
+        if month and len(day) <= 2 and day.isdigit() and len(year) == 4 and year.isdigit():
+            # Reject impossible days such as Feb 31, as strptime did
+            if 1 <= int(day) <= calendar.monthrange(int(year), int(month))[1]:
+                return f"{year}-{month}-{day.zfill(2)}"
 
     return None
 
 
+def _engagement_score(tweet: Dict[str, Any]) -> float:
+    """Normalized 0-1 engagement score for a tweet.
+
+    Args:
+        tweet: Raw tweet dict
+
+    Returns:
+        Engagement score between 0.0 and 1.0
+    """
+    # Log-scaled with same weights as score.py
+    likes = math.log1p(max(0, tweet.get("likeCount", 0) or 0))
+    reposts = math.log1p(max(0, tweet.get("retweetCount", 0) or 0))
+    replies = math.log1p(max(0, tweet.get("replyCount", 0) or 0))
+    quotes = math.log1p(max(0, tweet.get("quoteCount", 0) or 0))
+
+    raw_engagement = _W_LIKES * likes + _W_REPOSTS * reposts + _W_REPLIES * replies + _W_QUOTES * quotes
+
+    # Normalize engagement to 0-1 (log1p(1000) ~ 6.9, so cap around 7)
+    return min(1.0, raw_engagement * _INV_7)
+
+
 def _compute_relevance(position: int, total: int, tweet: Dict[str, Any]) -> float:
     """Compute relevance score for a tweet.
 
@@ -177,23 +216,7 @@ def _compute_relevance(position: int, total: int, tweet: Dict[str, Any]) -> floa
     else:
         position_score = 1.0 - 0.5 * (position / (total - 1))
 
-    # Engagement score: log-scaled with same weights as score.py
-    likes = math.log1p(max(0, tweet.get("likeCount", 0) or 0))
-    reposts = math.log1p(max(0, tweet.get("retweetCount", 0) or 0))
-    replies = math.log1p(max(0, tweet.get("replyCount", 0) or 0))
-    quotes = math.log1p(max(0, tweet.get("quoteCount", 0) or 0))
-
-    raw_engagement = (
-        ENGAGEMENT_WEIGHTS["likes"] * likes
-        + ENGAGEMENT_WEIGHTS["reposts"] * reposts
-        + ENGAGEMENT_WEIGHTS["replies"] * replies
-        + ENGAGEMENT_WEIGHTS["quotes"] * quotes
-    )
-
-    # Normalize engagement to 0-1 (log1p(1000) ~ 6.9, so cap around 7)
-    engagement_score = min(1.0, raw_engagement / 7.0)
-
-    return 0.6 * position_score + 0.4 * engagement_score
+    return 0.6 * position_score + 0.4 * _engagement_score(tweet)
 
 
 def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -212,6 +235,7 @@ def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         return items
 
     total = len(tweets)
+    seen_urls = set()
 
     for i, tweet in enumerate(tweets):
         if not isinstance(tweet, dict):
@@ -228,6 +252,11 @@ def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
             else:
                 continue
 
+        # "Top" results can repeat a tweet across pages; keep the first
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
+
         # Extract author handle
         author = tweet.get("author", {})
         author_handle = ""
@@ -249,15 +278,23 @@ def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         # Compute relevance
         relevance = _compute_relevance(i, total, tweet)
 
+        # Text is almost always a short str from JSON; only convert/trim if needed
+        text = tweet.get("text") or ""
+        if not isinstance(text, str):
+            text = str(text)
+        text = text.strip()
+        if len(text) > 500:
+            text = text[:500]
+
         clean_item = {
             "id": f"X{i + 1}",
-            "text": str(tweet.get("text", "")).strip()[:500],
+            "text": text,
             "url": url,
             "author_handle": author_handle,
             "date": date,
             "engagement": engagement,
             "why_relevant": "",
-            "relevance": min(1.0, max(0.0, relevance)),
+            "relevance": score.clamp01(relevance),
         }
 
         items.append(clean_item)
@@ -1,8 +1,11 @@
 """Tests for cache module."""
 
+import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 # Add lib to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -55,5 +58,66 @@ class TestModelCache(unittest.TestCase):
         self.assertTrue(result is None or isinstance(result, str))
 
 
+class TestCachedSearch(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        # ensure_cache_dir() would redirect CACHE_DIR to a user-set override
+        self._env = mock.patch.dict(os.environ, {"LAST30DAYS_CACHE_DIR": self._tmp.name})
+        self._env.start()
+        self._orig_dir = cache.CACHE_DIR
+        self._orig_model_file = cache.MODEL_CACHE_FILE
+        cache.CACHE_DIR = Path(self._tmp.name)
+        self.calls = 0
+
+    def tearDown(self):
+        self._env.stop()
+        cache.CACHE_DIR = self._orig_dir
+        cache.MODEL_CACHE_FILE = self._orig_model_file
+        cache.SEARCH_CACHE_ENABLED = True
+        self._tmp.cleanup()
+
+    def _fetch(self, result):
+        def fetch():
+            self.calls += 1
+            return result
+        return fetch
+
+    def test_second_call_served_from_cache(self):
+        args = ("dailydev", "topic", "2026-01-01", "2026-01-31", "default")
+        first = cache.cached_search(*args, self._fetch({"data": [1]}))
+        second = cache.cached_search(*args, self._fetch({"data": [2]}))
+        self.assertEqual(first, {"data": [1]})
+        self.assertEqual(second, {"data": [1]})
+        self.assertEqual(self.calls, 1)
+
+    def test_source_and_depth_in_key(self):
+        cache.cached_search("dailydev", "t", "2026-01-01", "2026-01-31", "default", self._fetch({}))
+        cache.cached_search("tubelab", "t", "2026-01-01", "2026-01-31", "default", self._fetch({}))
+        cache.cached_search("dailydev", "t", "2026-01-01", "2026-01-31", "deep", self._fetch({}))
+        self.assertEqual(self.calls, 3)
+
+    def test_errors_not_cached(self):
+        args = ("dailydev", "topic", "2026-01-01", "2026-01-31", "default")
+        cache.cached_search(*args, self._fetch({"error": "boom"}))
+        cache.cached_search(*args, self._fetch({"error": "boom"}))
+        self.assertEqual(self.calls, 2)
+
+    def test_unusable_cache_dir_still_fetches(self):
+        blocker = Path(self._tmp.name) / "file"
+        blocker.write_text("")
+        os.environ["LAST30DAYS_CACHE_DIR"] = str(blocker / "cache")
+        args = ("dailydev", "topic", "2026-01-01", "2026-01-31", "default")
+        self.assertEqual(cache.cached_search(*args, self._fetch({"data": [1]})), {"data": [1]})
+        self.assertEqual(cache.cached_search(*args, self._fetch({"data": [1]})), {"data": [1]})
+        self.assertEqual(self.calls, 2)
+
+    def test_disabled(self):
+        cache.SEARCH_CACHE_ENABLED = False
+        args = ("dailydev", "topic", "2026-01-01", "2026-01-31", "default")
+        cache.cached_search(*args, self._fetch({"data": []}))
+        cache.cached_search(*args, self._fetch({"data": []}))
+        self.assertEqual(self.calls, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
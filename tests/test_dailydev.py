@@ -69,6 +69,14 @@ class TestParseDailyDevResponse(unittest.TestCase):
         items = dailydev.parse_dailydev_response({"data": []})
         self.assertEqual(items, [])
 
+    def test_error_response(self):
+        items = dailydev.parse_dailydev_response({"error": "HTTP 500"})
+        self.assertEqual(items, [])
+
+    def test_non_list_posts(self):
+        items = dailydev.parse_dailydev_response({"data": {"title": "not a list"}})
+        self.assertEqual(items, [])
+
     def test_relevance_decreases_with_position(self):
         items = dailydev.parse_dailydev_response(self.fixture)
         # First item should generally have higher relevance than last
@@ -87,6 +95,17 @@ class TestParseDailyDevResponse(unittest.TestCase):
         self.assertEqual(len(items), 1)
         self.assertEqual(items[0]["title"], "Valid Title")
 
+    def test_skips_duplicate_urls(self):
+        response = {
+            "data": [
+                {"id": "1", "title": "First", "url": "https://example.com/post/"},
+                {"id": "2", "title": "Repeat", "url": "https://Example.com/post?ref=dd"},
+                {"id": "3", "title": "Other", "url": "https://example.com/other"},
+            ]
+        }
+        items = dailydev.parse_dailydev_response(response)
+        self.assertEqual([item["title"] for item in items], ["First", "Other"])
+
     def test_legacy_posts_key(self):
         """Ensure old fixture format with 'posts' key still works."""
         response = {
@@ -0,0 +1,94 @@
+"""Tests for env module."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import env
+
+
+class TestLoadEnvFile(unittest.TestCase):
+    def setUp(self):
+        env.reset_cache()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / ".env"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        env.reset_cache()
+
+    def test_missing_file(self):
+        self.assertEqual(env.load_env_file(self.path), {})
+
+    def test_parses_values(self):
+        self.path.write_text(
+            "# comment\n"
+            "OPENAI_API_KEY=sk-test\n"
+            "  BRAVE_API_KEY = \"quoted value\"\n"
+            "TUBELAB_API_KEY='single'\n"
+            "EMPTY=\n"
+            "no equals sign\n"
+        )
+        self.assertEqual(env.load_env_file(self.path), {
+            "OPENAI_API_KEY": "sk-test",
+            "BRAVE_API_KEY": "quoted value",
+            "TUBELAB_API_KEY": "single",
+        })
+
+    def test_reparses_after_edit(self):
+        self.path.write_text("OPENAI_API_KEY=old\n")
+        self.assertEqual(env.load_env_file(self.path)["OPENAI_API_KEY"], "old")
+        self.path.write_text("OPENAI_API_KEY=new\n")
+        stat = self.path.stat()
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(env.load_env_file(self.path)["OPENAI_API_KEY"], "new")
+
+    def test_returns_independent_copies(self):
+        self.path.write_text("OPENAI_API_KEY=sk-test\n")
+        env.load_env_file(self.path)["OPENAI_API_KEY"] = "mutated"
+        self.assertEqual(env.load_env_file(self.path)["OPENAI_API_KEY"], "sk-test")
+
+
+class TestGetConfig(unittest.TestCase):
+    def setUp(self):
+        env.reset_cache()
+        self._config_file = env.CONFIG_FILE
+        self._environ = {key: os.environ.pop(key) for key in env._CONFIG_KEYS if key in os.environ}
+        self.tmpdir = tempfile.TemporaryDirectory()
+        env.CONFIG_FILE = Path(self.tmpdir.name) / ".env"
+
+    def tearDown(self):
+        env.CONFIG_FILE = self._config_file
+        for key in env._CONFIG_KEYS:
+            os.environ.pop(key, None)
+        os.environ.update(self._environ)
+        self.tmpdir.cleanup()
+        env.reset_cache()
+
+    def test_environment_overrides_file(self):
+        env.CONFIG_FILE.write_text("OPENAI_API_KEY=from-file\nBRAVE_API_KEY=brave\n")
+        os.environ["OPENAI_API_KEY"] = "from-env"
+        config = env.get_config()
+        self.assertEqual(config["OPENAI_API_KEY"], "from-env")
+        self.assertEqual(config["BRAVE_API_KEY"], "brave")
+        self.assertEqual(config["OPENAI_MODEL_POLICY"], "auto")
+
+    def test_environment_change_invalidates(self):
+        self.assertIsNone(env.get_config()["OPENAI_API_KEY"])
+        os.environ["OPENAI_API_KEY"] = "sk-later"
+        self.assertEqual(env.get_config()["OPENAI_API_KEY"], "sk-later")
+
+    def test_xai_key_fallback(self):
+        os.environ["XAI_API_KEY"] = "xai-old"
+        config = env.get_config()
+        self.assertEqual(config["TWITTERAPI_IO_KEY"], "xai-old")
+        self.assertTrue(config["_HAS_OLD_XAI_KEY"])
+
+
+if __name__ == "__main__":
+    unittest.main()
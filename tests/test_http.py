@@ -0,0 +1,122 @@
+"""Tests for http module."""
+
+import json
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import http
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ports = []
+
+    def _reply(self, status, payload=None, extra_headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        _Handler.ports.append(self.client_address[1])
+        if self.path.startswith("/ok"):
+            self._reply(200, {"path": self.path})
+        elif self.path == "/redirect":
+            self._reply(302, extra_headers={"Location": "/ok?from=redirect"})
+        elif self.path == "/missing":
+            self._reply(404, {"error": "not found"})
+        else:
+            self._reply(500, {"error": "boom"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        self._reply(200, {"echo": payload})
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRequest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls._proxies = http._PROXIES
+        http._PROXIES = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        http._PROXIES = cls._proxies
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.ports.clear()
+
+    def test_get_json(self):
+        result = http.get(f"{self.base}/ok?q=1")
+        self.assertEqual(result, {"path": "/ok?q=1"})
+
+    def test_params_encoded(self):
+        result = http.get(f"{self.base}/ok", params={"q": "c++ & rust #1", "limit": 5})
+        self.assertEqual(result, {"path": "/ok?q=c%2B%2B+%26+rust+%231&limit=5"})
+
+    def test_params_appended_to_existing_query(self):
+        result = http.get(f"{self.base}/ok?a=1", params={"b": 2})
+        self.assertEqual(result, {"path": "/ok?a=1&b=2"})
+
+    def test_post_json(self):
+        result = http.post(f"{self.base}/echo", {"a": 1})
+        self.assertEqual(result, {"echo": {"a": 1}})
+
+    def test_connection_reused(self):
+        http.get(f"{self.base}/ok")
+        http.get(f"{self.base}/ok")
+        self.assertEqual(len(set(_Handler.ports)), 1)
+
+    def test_pool_used_with_only_no_proxy(self):
+        http._PROXIES = {"no": "localhost"}
+        try:
+            http.get(f"{self.base}/ok")
+            http.get(f"{self.base}/ok")
+        finally:
+            http._PROXIES = {}
+        self.assertEqual(len(set(_Handler.ports)), 1)
+
+    def test_follows_redirect(self):
+        result = http.get(f"{self.base}/redirect")
+        self.assertEqual(result, {"path": "/ok?from=redirect"})
+
+    def test_client_error_not_retried(self):
+        with self.assertRaises(http.HTTPError) as ctx:
+            http.get(f"{self.base}/missing", retries=3)
+        self.assertEqual(ctx.exception.status_code, 404)
+        self.assertEqual(len(_Handler.ports), 1)
+
+    def test_server_error_retried(self):
+        original_delay = http.RETRY_DELAY
+        http.RETRY_DELAY = 0
+        try:
+            with self.assertRaises(http.HTTPError) as ctx:
+                http.get(f"{self.base}/fail", retries=2)
+        finally:
+            http.RETRY_DELAY = original_delay
+        self.assertEqual(ctx.exception.status_code, 500)
+        self.assertEqual(len(_Handler.ports), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 """Tests for openai_reddit module."""
 
+import json
 import sys
 import unittest
 from pathlib import Path
@@ -8,7 +9,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from lib import http
-from lib.openai_reddit import _is_model_access_error, MODEL_FALLBACK_ORDER
+from lib.openai_reddit import (
+    _extract_items_json,
+    _is_model_access_error,
+    MODEL_FALLBACK_ORDER,
+    parse_reddit_response,
+)
 
 
 class TestIsModelAccessError(unittest.TestCase):
@@ -73,5 +79,95 @@ class TestModelFallbackOrder(unittest.TestCase):
         self.assertEqual(MODEL_FALLBACK_ORDER[0], "gpt-4o")
 
 
+class TestExtractItemsJson(unittest.TestCase):
+    """Tests for _extract_items_json function."""
+
+    def test_json_surrounded_by_prose(self):
+        text = 'Here are the threads:\n{"items": [{"title": "A"}]}\nLet me know {if} you need more.'
+        self.assertEqual(_extract_items_json(text), {"items": [{"title": "A"}]})
+
+    def test_skips_leading_braces(self):
+        text = 'Use {core subject} and {"note": 1} then {"items": []}'
+        self.assertEqual(_extract_items_json(text), {"items": []})
+
+    def test_no_items_object(self):
+        self.assertIsNone(_extract_items_json('{"results": []} and {broken'))
+
+    def test_no_json(self):
+        self.assertIsNone(_extract_items_json("No threads found."))
+
+
+class TestParseRedditResponse(unittest.TestCase):
+    """Tests for parse_reddit_response item validation."""
+
+    def _parse(self, items):
+        text = json.dumps({"items": items})
+        return parse_reddit_response({"output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}]})
+
+    def test_cleans_fields(self):
+        result = self._parse([{
+            "title": "  Thread  ",
+            "url": "https://www.reddit.com/r/test/comments/abc/thread/",
+            "subreddit": "r/test",
+            "date": "2026-01-15",
+            "why_relevant": 42,
+            "relevance": 1.7,
+        }])
+        self.assertEqual(result, [{
+            "id": "R1",
+            "title": "Thread",
+            "url": "https://www.reddit.com/r/test/comments/abc/thread/",
+            "subreddit": "test",
+            "date": "2026-01-15",
+            "why_relevant": "42",
+            "relevance": 1.0,
+        }])
+
+    def test_relevance_clamped(self):
+        scores = [-0.5, 0.25, 3, "nan"]
+        result = self._parse([
+            {"url": f"https://www.reddit.com/r/test/comments/r{n}/thread/", "relevance": r}
+            for n, r in enumerate(scores)
+        ])
+        self.assertEqual([item["relevance"] for item in result], [0.0, 0.25, 1.0, 0.0])
+
+    def test_invalid_dates_dropped(self):
+        dates = ["2026/01/15", "2026-1-15", "Jan 15 2026", 20260115, "2026-01-15\n"]
+        result = self._parse([
+            {"url": f"https://www.reddit.com/r/test/comments/t{n}/thread/", "date": d}
+            for n, d in enumerate(dates)
+        ])
+        self.assertEqual([item["date"] for item in result], [None] * len(dates))
+
+    def test_skips_non_reddit_urls(self):
+        result = self._parse([
+            {"url": "https://example.com"},
+            {"url": "https://reddit.com.example.net/r/test/comments/abc/"},
+            {"url": "https://example.com/?next=https://www.reddit.com/"},
+            {"url": 123},
+            {},
+        ])
+        self.assertEqual(result, [])
+
+    def test_accepts_reddit_hosts(self):
+        urls = [
+            "https://reddit.com/r/test/comments/a1/",
+            "https://www.reddit.com/r/test/comments/b2/",
+            "https://old.reddit.com/r/test/comments/c3/",
+            "http://www.reddit.com/r/test/comments/d4/",
+        ]
+        result = self._parse([{"url": url} for url in urls])
+        self.assertEqual([item["url"] for item in result], urls)
+
+    def test_skips_duplicate_threads(self):
+        result = self._parse([
+            {"url": "https://www.reddit.com/r/Test/comments/abc/thread/", "title": "first"},
+            {"url": "https://old.reddit.com/r/test/comments/abc/thread?utm=x", "title": "repeat"},
+            {"url": "https://www.reddit.com/r/test/comments/def/other/", "title": "other"},
+        ])
+        self.assertEqual([item["title"] for item in result], ["first", "other"])
+        self.assertEqual([item["id"] for item in result], ["R1", "R3"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+"""Tests for pipeline module."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import pipeline, schema
+
+
+def _reddit(item_id, title, date, relevance=0.5):
+    return {
+        "id": item_id,
+        "title": title,
+        "url": f"https://reddit.com/r/test/comments/{item_id}",
+        "subreddit": "test",
+        "date": date,
+        "relevance": relevance,
+    }
+
+
+class TestProcessSource(unittest.TestCase):
+    def test_empty_input(self):
+        self.assertEqual(pipeline.process_source([], "2026-01-01", "2026-01-31", "reddit"), ([], []))
+
+    def test_filters_out_of_range_dates(self):
+        items = [
+            _reddit("a", "In range thread", "2026-01-15"),
+            _reddit("b", "Too old thread about something else", "2025-06-01"),
+        ]
+        normalized, processed = pipeline.process_source(items, "2026-01-01", "2026-01-31", "reddit")
+        self.assertEqual(len(normalized), 2)
+        self.assertEqual([item.id for item in processed], ["a"])
+        self.assertIsInstance(processed[0], schema.RedditItem)
+
+    def test_youtube_skips_date_filter(self):
+        items = [{"id": "v1", "title": "Old but evergreen", "url": "https://youtu.be/v1", "date": "2025-01-01"}]
+        _, processed = pipeline.process_source(items, "2026-01-01", "2026-01-31", "youtube")
+        self.assertEqual(len(processed), 1)
+
+    def test_sorted_and_deduped(self):
+        items = [
+            _reddit("a", "Claude Code skills guide", "2026-01-10", relevance=0.3),
+            _reddit("b", "Claude Code skills guide!", "2026-01-20", relevance=0.9),
+            _reddit("c", "Completely different topic", "2026-01-15", relevance=0.6),
+        ]
+        _, processed = pipeline.process_source(items, "2026-01-01", "2026-01-31", "reddit")
+        self.assertEqual([item.id for item in processed], ["b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Tests for reddit_enrich module."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import reddit_enrich
+
+
+class TestExtractThreadFullname(unittest.TestCase):
+    def test_thread_url(self):
+        url = "https://www.reddit.com/r/ClaudeAI/comments/1AbC2d/some_title/"
+        self.assertEqual(reddit_enrich.extract_thread_fullname(url), "t3_1abc2d")
+
+    def test_non_thread_url(self):
+        self.assertIsNone(reddit_enrich.extract_thread_fullname("https://www.reddit.com/r/ClaudeAI/"))
+
+    def test_non_reddit_url(self):
+        self.assertIsNone(reddit_enrich.extract_thread_fullname("https://example.com/comments/abc"))
+
+
+class TestEnrichRedditItemsBatch(unittest.TestCase):
+    def test_applies_submission_data(self):
+        items = [
+            {"url": "https://www.reddit.com/r/test/comments/abc/one/", "date": None},
+            {"url": "https://www.reddit.com/r/test/comments/def/two/", "date": None},
+        ]
+        submissions = {
+            "t3_abc": {"score": 42, "num_comments": 7, "upvote_ratio": 0.9, "created_utc": 1768478400},
+        }
+        reddit_enrich.enrich_reddit_items_batch(items, mock_submissions=submissions)
+        self.assertEqual(items[0]["engagement"], {"score": 42, "num_comments": 7, "upvote_ratio": 0.9})
+        self.assertEqual(items[0]["date"], "2026-01-15")
+        self.assertNotIn("engagement", items[1])
+
+    def test_no_thread_urls(self):
+        items = [{"url": "https://example.com"}]
+        self.assertIs(reddit_enrich.enrich_reddit_items_batch(items, mock_submissions={}), items)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,6 +29,18 @@ class TestLog1pSafe(unittest.TestCase):
         self.assertEqual(result, 0)
 
 
+class TestClamp01(unittest.TestCase):
+    def test_in_range_unchanged(self):
+        self.assertEqual(score.clamp01(0.25), 0.25)
+
+    def test_out_of_range(self):
+        self.assertEqual(score.clamp01(-0.5), 0.0)
+        self.assertEqual(score.clamp01(1.7), 1.0)
+
+    def test_nan(self):
+        self.assertEqual(score.clamp01(float("nan")), 0.0)
+
+
 class TestComputeRedditEngagementRaw(unittest.TestCase):
     def test_with_engagement(self):
         eng = schema.Engagement(score=100, num_comments=50, upvote_ratio=0.9)
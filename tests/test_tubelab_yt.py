@@ -10,6 +10,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from lib import tubelab_yt, schema
 
+_YT_PREFIX = "https://www.youtube.com/watch?v="
+
 
 class TestSearchYouTube(unittest.TestCase):
     def test_mock_response_passthrough(self):
@@ -30,18 +32,18 @@ class TestSearchYouTube(unittest.TestCase):
 
 
 class TestParseYouTubeResponse(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         fixture_path = Path(__file__).parent.parent / "fixtures" / "tubelab_sample.json"
         with open(fixture_path) as f:
-            self.fixture = json.load(f)
+            cls.fixture = json.load(f)
+        cls.items = tubelab_yt.parse_youtube_response(cls.fixture)
 
     def test_parses_fixture(self):
-        items = tubelab_yt.parse_youtube_response(self.fixture)
-        self.assertEqual(len(items), 4)
+        self.assertEqual(len(self.items), 4)
 
     def test_field_mapping(self):
-        items = tubelab_yt.parse_youtube_response(self.fixture)
-        first = items[0]
+        first = self.items[0]
 
         self.assertEqual(first["id"], "YT1")
         self.assertEqual(first["title"], "Building Production AI Agents - Complete Tutorial")
@@ -52,8 +54,7 @@ class TestParseYouTubeResponse(unittest.TestCase):
         self.assertEqual(first["duration"], 720)
 
     def test_engagement_mapping(self):
-        items = tubelab_yt.parse_youtube_response(self.fixture)
-        first = items[0]
+        first = self.items[0]
 
         self.assertIsNotNone(first["engagement"])
         self.assertEqual(first["engagement"]["views"], 245000)
@@ -69,15 +70,12 @@ class TestParseYouTubeResponse(unittest.TestCase):
         self.assertEqual(items, [])
 
     def test_url_construction(self):
-        items = tubelab_yt.parse_youtube_response(self.fixture)
-        for item in items:
-            self.assertTrue(item["url"].startswith("https://www.youtube.com/watch?v="))
+        urls = [item["url"] for item in self.items]
+        self.assertTrue(all(url.startswith(_YT_PREFIX) for url in urls), urls)
 
     def test_relevance_scores(self):
-        items = tubelab_yt.parse_youtube_response(self.fixture)
-        for item in items:
-            self.assertGreater(item["relevance"], 0)
-            self.assertLessEqual(item["relevance"], 1.0)
+        scores = [item["relevance"] for item in self.items]
+        self.assertTrue(all(0 < score <= 1.0 for score in scores), scores)
 
     def test_skips_items_without_title(self):
         response = {
@@ -90,6 +88,17 @@ class TestParseYouTubeResponse(unittest.TestCase):
         self.assertEqual(len(items), 1)
         self.assertEqual(items[0]["title"], "Valid Title")
 
+    def test_skips_duplicate_videos(self):
+        response = {
+            "videos": [
+                {"id": "abc", "title": "First"},
+                {"id": "abc", "title": "Repeat"},
+                {"id": "def", "title": "Other"},
+            ]
+        }
+        items = tubelab_yt.parse_youtube_response(response)
+        self.assertEqual([item["title"] for item in items], ["First", "Other"])
+
 
 class TestComputeRelevance(unittest.TestCase):
     def test_first_position_high_relevance(self):
@@ -1,5 +1,6 @@
 """Tests for twitterapi_x module."""
 
+import functools
 import json
 import sys
 import unittest
@@ -10,6 +11,38 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from lib import twitterapi_x
 
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+# Keys produced by xai_x.parse_x_response(), which this parser must match
+_EXPECTED_ITEM_KEYS = frozenset({"id", "text", "url", "author_handle", "date", "engagement", "why_relevant", "relevance"})
+_EXPECTED_ENGAGEMENT_KEYS = frozenset({"likes", "reposts", "replies", "quotes"})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture(name):
+    """Load a fixture once per run; callers must not mutate the result."""
+    with open(FIXTURES_DIR / name) as f:
+        return json.load(f)
+
+
+# Pass as an override to _make_tweet to leave that key out of the tweet
+_MISSING = object()
+
+
+def _make_tweet(**overrides):
+    """Build a one-tweet API response; keyword args override tweet fields."""
+    tweet = {
+        "id": "1",
+        "text": "x",
+        "author": {"userName": "u"},
+        "likeCount": 0,
+        "retweetCount": 0,
+        "replyCount": 0,
+        "quoteCount": 0,
+    }
+    tweet.update(overrides)
+    return {"tweets": [{k: v for k, v in tweet.items() if v is not _MISSING}]}
+
 
 class TestBuildQuery(unittest.TestCase):
     def test_default_depth(self):
@@ -65,6 +98,26 @@ class TestParseCreatedAt(unittest.TestCase):
         result = twitterapi_x._parse_created_at("not a date")
         self.assertIsNone(result)
 
+    def test_twitter_format_single_digit_day(self):
+        result = twitterapi_x._parse_created_at("Thu Feb 5 09:00:00 +0000 2026")
+        self.assertEqual(result, "2026-02-05")
+
+    def test_digit_start_not_iso(self):
+        result = twitterapi_x._parse_created_at("2026/01/15 14:30:00")
+        self.assertIsNone(result)
+
+    def test_twitter_format_bad_month(self):
+        result = twitterapi_x._parse_created_at("Wed Foo 15 14:30:00 +0000 2026")
+        self.assertIsNone(result)
+
+    def test_twitter_format_impossible_day(self):
+        self.assertIsNone(twitterapi_x._parse_created_at("Sat Feb 31 10:00:00 +0000 2026"))
+        self.assertIsNone(twitterapi_x._parse_created_at("Sun Feb 29 10:00:00 +0000 2026"))
+        self.assertEqual(twitterapi_x._parse_created_at("Thu Feb 29 10:00:00 +0000 2024"), "2024-02-29")
+
+    def test_twitter_format_three_digit_day(self):
+        self.assertIsNone(twitterapi_x._parse_created_at("Wed Jan 007 14:30:00 +0000 2026"))
+
 
 class TestComputeRelevance(unittest.TestCase):
     def test_first_position_high_engagement(self):
@@ -106,12 +159,12 @@ class TestSearchX(unittest.TestCase):
 
 
 class TestParseXResponse(unittest.TestCase):
-    def test_parse_fixture(self):
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "twitterapi_sample.json"
-        with open(fixture_path) as f:
-            response = json.load(f)
+    @classmethod
+    def setUpClass(cls):
+        cls.items = twitterapi_x.parse_x_response(_load_fixture("twitterapi_sample.json"))
 
-        items = twitterapi_x.parse_x_response(response)
+    def test_parse_fixture(self):
+        items = self.items
 
         self.assertEqual(len(items), 4)
 
@@ -130,28 +183,22 @@ class TestParseXResponse(unittest.TestCase):
 
     def test_output_format_compat(self):
         """Ensure output dict has same keys as xai_x.parse_x_response()."""
-        response = {"tweets": [
-            {
-                "id": "123",
-                "text": "test tweet",
-                "url": "https://x.com/user/status/123",
-                "createdAt": "Wed Jan 15 14:30:00 +0000 2026",
-                "author": {"userName": "testuser"},
-                "likeCount": 10,
-                "retweetCount": 2,
-                "replyCount": 1,
-                "quoteCount": 0,
-            }
-        ]}
+        response = _make_tweet(
+            id="123",
+            text="test tweet",
+            url="https://x.com/user/status/123",
+            createdAt="Wed Jan 15 14:30:00 +0000 2026",
+            author={"userName": "testuser"},
+            likeCount=10,
+            retweetCount=2,
+            replyCount=1,
+        )
 
         items = twitterapi_x.parse_x_response(response)
         self.assertEqual(len(items), 1)
 
-        expected_keys = {"id", "text", "url", "author_handle", "date", "engagement", "why_relevant", "relevance"}
-        self.assertEqual(set(items[0].keys()), expected_keys)
-
-        eng_keys = {"likes", "reposts", "replies", "quotes"}
-        self.assertEqual(set(items[0]["engagement"].keys()), eng_keys)
+        self.assertEqual(items[0].keys(), _EXPECTED_ITEM_KEYS)
+        self.assertEqual(items[0]["engagement"].keys(), _EXPECTED_ENGAGEMENT_KEYS)
 
     def test_empty_tweets(self):
         result = twitterapi_x.parse_x_response({"tweets": []})
@@ -165,53 +212,46 @@ class TestParseXResponse(unittest.TestCase):
         result = twitterapi_x.parse_x_response({"tweets": ["not a dict"]})
         self.assertEqual(result, [])
 
-    def test_tweet_without_url_builds_from_author(self):
-        response = {"tweets": [
-            {
-                "id": "456",
-                "text": "tweet without url",
-                "author": {"userName": "user1"},
-                "likeCount": 5,
-                "retweetCount": 0,
-                "replyCount": 0,
-                "quoteCount": 0,
-            }
-        ]}
+    def test_url_resolution(self):
+        cases = [
+            ("explicit url", {"url": "https://x.com/user/status/123"}, "https://x.com/user/status/123"),
+            ("built from author", {"id": "456", "author": {"userName": "user1"}}, "https://x.com/user1/status/456"),
+            ("no url or author", {"id": "789", "author": _MISSING}, None),
+            ("null author", {"id": "790", "author": None}, None),
+        ]
+        for name, overrides, expected_url in cases:
+            with self.subTest(case=name):
+                items = twitterapi_x.parse_x_response(_make_tweet(**overrides))
+                self.assertEqual([item["url"] for item in items], [expected_url] if expected_url else [])
+
+    def test_duplicate_tweets_skipped(self):
+        tweet = {"id": "1", "url": "https://x.com/a/status/1", "text": "first"}
+        response = {"tweets": [tweet, dict(tweet, text="repeat"), {"id": "2", "url": "https://x.com/a/status/2"}]}
         items = twitterapi_x.parse_x_response(response)
-        self.assertEqual(len(items), 1)
-        self.assertEqual(items[0]["url"], "https://x.com/user1/status/456")
+        self.assertEqual([item["url"] for item in items], ["https://x.com/a/status/1", "https://x.com/a/status/2"])
+        self.assertEqual(items[0]["text"], "first")
 
-    def test_tweet_without_url_or_author_skipped(self):
+    def test_text_cleaned(self):
         response = {"tweets": [
-            {
-                "id": "789",
-                "text": "orphan tweet",
-                "likeCount": 5,
-            }
+            {"id": "1", "url": "https://x.com/a/status/1", "text": "  padded  "},
+            {"id": "2", "url": "https://x.com/a/status/2", "text": "x" * 600},
+            {"id": "3", "url": "https://x.com/a/status/3", "text": None},
+            {"id": "4", "url": "https://x.com/a/status/4"},
         ]}
         items = twitterapi_x.parse_x_response(response)
-        self.assertEqual(len(items), 0)
+        self.assertEqual([len(item["text"]) for item in items], [6, 500, 0, 0])
+        self.assertEqual(items[0]["text"], "padded")
 
     def test_iso_date_parsed(self):
         """Last fixture item uses ISO format."""
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "twitterapi_sample.json"
-        with open(fixture_path) as f:
-            response = json.load(f)
-
-        items = twitterapi_x.parse_x_response(response)
         # 4th item has ISO format date
-        self.assertEqual(items[3]["date"], "2026-01-05")
+        self.assertEqual(self.items[3]["date"], "2026-01-05")
 
     def test_relevance_decreases_with_position(self):
         """First item should have higher relevance than last."""
-        fixture_path = Path(__file__).parent.parent / "fixtures" / "twitterapi_sample.json"
-        with open(fixture_path) as f:
-            response = json.load(f)
-
-        items = twitterapi_x.parse_x_response(response)
         # Item 2 has highest engagement but is 2nd position
         # Item 1 is first position - should still score high
-        self.assertGreater(items[0]["relevance"], items[3]["relevance"])
+        self.assertGreater(self.items[0]["relevance"], self.items[3]["relevance"])
 
 
 if __name__ == "__main__":